@@ -7,7 +7,13 @@ Multi-agent fact-checking system using LangGraph and Gemini 2.5 Flash.
 from agents.fact_checker import FactChecker
 from agents.forensic_expert import ForensicExpert
 from agents.judge import TheJudge
-from agents.claim_processor import ClaimProcessor, ClaimType, ClaimMetadata, is_verdict_fresh
+from agents.claim_processor import (
+    ClaimProcessor,
+    ClaimType,
+    ClaimMetadata,
+    generate_claim_hash,
+    is_verdict_fresh,
+)
 
 __all__ = [
     "FactChecker", 
@@ -16,5 +22,6 @@ __all__ = [
     "ClaimProcessor",
     "ClaimType",
     "ClaimMetadata",
+    "generate_claim_hash",
     "is_verdict_fresh"
 ]
@@ -100,28 +100,31 @@ Return ONLY the 3 queries, one per line, no numbering or bullets."""
     }
 
 
-def executor_node(state: FactCheckerState) -> FactCheckerState:
+async def executor_node(state: FactCheckerState) -> FactCheckerState:
     """Fetch search results for each query using ASYNC PARALLEL execution."""
     queries = state["search_queries"]
     tavily_api_key = os.getenv("TAVILY_API_KEY")
     
     if tavily_api_key:
         try:
-            results = asyncio.run(_parallel_tavily_search(queries, tavily_api_key))
+            results = await _parallel_tavily_search(queries, tavily_api_key)
         except Exception:
-            results = _simulate_search(queries)
+            results = await asyncio.to_thread(_simulate_search, queries)
     else:
-        results = _simulate_search(queries)
+        results = await asyncio.to_thread(_simulate_search, queries)
     
     return {**state, "search_results": results}
 
 
+async def _close_tavily_client(client):
+    """Release the client's HTTP pool (tavily-python >= 0.7 keeps one open; older versions don't)."""
+    close = getattr(client, "close", None)
+    if close is not None:
+        await close()
+
+
 async def _parallel_tavily_search(queries: list[str], api_key: str) -> list[dict]:
     """Execute multiple Tavily searches in parallel for maximum speed."""
-    from tavily import AsyncTavilyClient
-    
-    client = AsyncTavilyClient(api_key=api_key)
-    
     # Check cache first, identify queries that need fetching
     cached_results = {}
     queries_to_fetch = []
@@ -135,6 +138,11 @@ async def _parallel_tavily_search(queries: list[str], api_key: str) -> list[dict
     
     # Parallel fetch for uncached queries
     if queries_to_fetch:
+        from tavily import AsyncTavilyClient
+        
+        # One client per batch, shared by its searches and closed on the loop that opened it
+        client = AsyncTavilyClient(api_key=api_key)
+        
         async def search_single(query: str) -> dict:
             try:
                 search_response = await client.search(
@@ -170,10 +178,13 @@ async def _parallel_tavily_search(queries: list[str], api_key: str) -> list[dict
                 return {"query": query, "results": [], "status": f"error: {str(e)}"}
         
         # Execute all searches in parallel
-        fetched = await asyncio.gather(
-            *(search_single(q) for q in queries_to_fetch),
-            return_exceptions=True
-        )
+        try:
+            fetched = await asyncio.gather(
+                *(search_single(q) for q in queries_to_fetch),
+                return_exceptions=True
+            )
+        finally:
+            await _close_tavily_client(client)
         
         # Process fetched results
         for i, result in enumerate(fetched):
@@ -332,6 +343,20 @@ class FactChecker:
         async for event in self.graph.astream(initial_state):
             yield event
     
+    async def averify_claim(self, claim: str) -> dict:
+        """Verify a claim asynchronously and return the evidence dossier."""
+        initial_state: FactCheckerState = {
+            "claim": claim,
+            "search_queries": [],
+            "search_results": [],
+            "analysis": "",
+            "is_sufficient": False,
+            "iteration_count": 0,
+            "evidence_dossier": {}
+        }
+        final_state = await self.graph.ainvoke(initial_state)
+        return final_state["evidence_dossier"]
+    
     @staticmethod
     def clear_cache():
         """Clear the search results cache."""
@@ -309,3 +309,16 @@ class ForensicExpert:
         }
         async for event in self.graph.astream(initial_state):
             yield event
+    
+    async def aanalyze_text(self, text: str) -> dict:
+        """Analyze text asynchronously and return the forensic log."""
+        initial_state: ForensicState = {
+            "raw_input": text,
+            "linguistic_analysis": {},
+            "ai_detection": {},
+            "integrity_score": 0.0,
+            "penalties_applied": [],
+            "forensic_log": {}
+        }
+        final_state = await self.graph.ainvoke(initial_state)
+        return final_state["forensic_log"]
@@ -3,7 +3,6 @@ import logging
 import asyncio
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -308,16 +307,14 @@ async def verify_claim(request: ClaimRequest):
         
         # Run agents in parallel
         logger.info("Running agents in parallel...")
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_a1 = executor.submit(fact_checker.verify_claim, claim)
-            future_a2 = executor.submit(forensic_expert.analyze_text, claim)
-            
-            a1_result = future_a1.result()
-            a2_result = future_a2.result()
+        a1_result, a2_result = await asyncio.gather(
+            fact_checker.averify_claim(claim),
+            forensic_expert.aanalyze_text(claim),
+        )
         
         # Get verdict from judge
         logger.info("Adjudicating verdict...")
-        aep = judge.adjudicate(a1_result, a2_result)
+        aep = await judge.aadjudicate(a1_result, a2_result)
         
         # Build complete AEP with all data
         processing_time = time.time() - start_time
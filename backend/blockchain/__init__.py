@@ -10,6 +10,7 @@ from blockchain.aptos_client import (
     VerdictRecord,
     VerdictValue,
     submit_verdict_to_chain,
+    update_shelby_cid_on_chain,
     check_verdict_exists,
     get_verdict_from_chain,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "VerdictRecord",
     "VerdictValue",
     "submit_verdict_to_chain",
+    "update_shelby_cid_on_chain",
     "check_verdict_exists",
     "get_verdict_from_chain",
     # Chain Lookup
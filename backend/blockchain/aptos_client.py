@@ -23,6 +23,13 @@ from aptos_sdk.bcs import Serializer
 import asyncio
 
 
+# BCS serializers for submit_verdict arguments, resolved once at import
+_STR_SER = Serializer.str
+_U8_SER = Serializer.u8
+_U64_SER = Serializer.u64
+_STR_SEQ_SER = Serializer.sequence_serializer(Serializer.str)
+
+
 class VerdictValue(IntEnum):
     """On-chain verdict values matching Move contract."""
     TRUE = 1
@@ -104,6 +111,10 @@ class AptosVerdictClient:
         
         self.account = Account.load_key(key)
         
+        # The registry lives at the module address and its admin is the account
+        # that initialized it there, so only that signer may call update_verdict
+        self.is_admin = int(str(self.account.address()), 16) == int(self.MODULE_ADDRESS, 16)
+        
         # Use Geomi API key if provided (removes rate limiting)
         geomi_api_key = api_key or os.getenv("GEOMI_API_KEY")
         if geomi_api_key:
@@ -114,6 +125,9 @@ class AptosVerdictClient:
             self.client = RestClient(self.REST_URL)
             print(f"[Aptos] Warning: No API key - subject to rate limits. Get one at https://geomi.dev/")
         
+        # In-flight view calls, keyed by request, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task] = {}
+        
     async def __aenter__(self):
         return self
         
@@ -122,10 +136,32 @@ class AptosVerdictClient:
     
     def _parse_view_result(self, result: bytes) -> list:
         """Parse bytes result from view function into Python objects."""
-        if isinstance(result, bytes):
-            return json.loads(result.decode('utf-8'))
+        if isinstance(result, (bytes, bytearray, str)):
+            # json.loads accepts bytes directly, no intermediate str copy
+            return json.loads(result) if result else []
         return result if result else []
     
+    async def _coalesced_view(self, key: str, function: str, args: list):
+        """
+        Call a view function, sharing the round-trip with identical concurrent calls.
+        
+        The request runs as one task per key that every caller awaits through
+        asyncio.shield, so cancelling one caller never cancels the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.client.view(function, [], args))
+            self._inflight[key] = task
+            
+            def _forget(done: asyncio.Task):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                if not done.cancelled():
+                    done.exception()  # Mark retrieved even if every caller was cancelled
+            
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+    
     @staticmethod
     def verdict_string_to_int(verdict: str) -> int:
         """Convert verdict string to on-chain integer value."""
@@ -162,7 +198,7 @@ class AptosVerdictClient:
         """
         try:
             function = f"{self.MODULE_ADDRESS}::{self.MODULE_NAME}::verdict_exists"
-            result = await self.client.view(function, [], [claim_hash])
+            result = await self._coalesced_view(f"exists:{claim_hash}", function, [claim_hash])
             parsed = self._parse_view_result(result)
             return parsed[0] if parsed else False
         except Exception as e:
@@ -181,7 +217,7 @@ class AptosVerdictClient:
         """
         try:
             function = f"{self.MODULE_ADDRESS}::{self.MODULE_NAME}::is_verdict_fresh"
-            result = await self.client.view(function, [], [claim_hash])
+            result = await self._coalesced_view(f"fresh:{claim_hash}", function, [claim_hash])
             parsed = self._parse_view_result(result)
             return parsed[0] if parsed else False
         except Exception:
@@ -199,21 +235,23 @@ class AptosVerdictClient:
         """
         try:
             function = f"{self.MODULE_ADDRESS}::{self.MODULE_NAME}::get_verdict"
-            result = await self.client.view(function, [], [claim_hash])
+            result = await self._coalesced_view(f"verdict:{claim_hash}", function, [claim_hash])
             parsed = self._parse_view_result(result)
             
             # Result is a list: [verdict, confidence, shelby_cid, timestamp, expiry, is_fresh]
+            # u8 and String already decode as int and str; only u64 arrives as a string
             if parsed and len(parsed) >= 6:
+                verdict, confidence, shelby_cid, timestamp, expiry = parsed[:5]
                 return VerdictRecord(
                     claim_hash=claim_hash,
                     claim_signature="",  # Not returned by view function
                     keywords=[],  # Not returned by view function
                     claim_type=0,  # Not returned by view function
-                    verdict=int(parsed[0]),
-                    confidence=int(parsed[1]),
-                    shelby_cid=str(parsed[2]),
-                    timestamp=int(parsed[3]),
-                    expiry=int(parsed[4]),
+                    verdict=verdict,
+                    confidence=confidence,
+                    shelby_cid=shelby_cid,
+                    timestamp=int(timestamp),
+                    expiry=int(expiry),
                     submitter="",  # Not returned by view function
                 )
             return None
@@ -276,14 +314,14 @@ class AptosVerdictClient:
                 "submit_verdict",
                 [],  # Type arguments
                 [
-                    TransactionArgument(claim_hash, Serializer.str),
-                    TransactionArgument(claim_signature, Serializer.str),
-                    TransactionArgument(keywords, Serializer.sequence_serializer(Serializer.str)),
-                    TransactionArgument(claim_type, Serializer.u8),
-                    TransactionArgument(verdict_int, Serializer.u8),
-                    TransactionArgument(confidence, Serializer.u8),  # u8 per Move contract
-                    TransactionArgument(shelby_cid, Serializer.str),
-                    TransactionArgument(expiry, Serializer.u64),
+                    TransactionArgument(claim_hash, _STR_SER),
+                    TransactionArgument(claim_signature, _STR_SER),
+                    TransactionArgument(keywords, _STR_SEQ_SER),
+                    TransactionArgument(claim_type, _U8_SER),
+                    TransactionArgument(verdict_int, _U8_SER),
+                    TransactionArgument(confidence, _U8_SER),  # u8 per Move contract
+                    TransactionArgument(shelby_cid, _STR_SER),
+                    TransactionArgument(expiry, _U64_SER),
                 ],
             )
             
@@ -305,6 +343,62 @@ class AptosVerdictClient:
             print(f"[Aptos] ✗ Error submitting verdict: {e}")
             return None
     
+    async def update_verdict(
+        self,
+        claim_hash: str,
+        verdict: str,
+        confidence: int,
+        shelby_cid: str,
+    ) -> Optional[str]:
+        """
+        Update an existing verdict, e.g. to attach a Shelby CID after the
+        verdict was submitted without one.
+        
+        Admin only: the contract aborts with E_UNAUTHORIZED for any other
+        signer, so non-admin clients return None without sending a transaction.
+        The update also resets the record's on-chain timestamp to now.
+        
+        Args:
+            claim_hash: The claim hash of the existing record.
+            verdict: Verdict string (TRUE, FALSE, PROBABLY_TRUE, etc.)
+            confidence: Confidence percentage (0-100).
+            shelby_cid: The Shelby CID for full report storage.
+            
+        Returns:
+            Transaction hash if successful, None otherwise.
+        """
+        if not self.is_admin:
+            print("[Aptos] ✗ update_verdict is admin-only - signer is not the registry admin")
+            return None
+        
+        try:
+            payload = EntryFunction.natural(
+                f"{self.MODULE_ADDRESS}::{self.MODULE_NAME}",
+                "update_verdict",
+                [],  # Type arguments
+                [
+                    TransactionArgument(claim_hash[:64], _STR_SER),
+                    TransactionArgument(self.verdict_string_to_int(verdict), _U8_SER),
+                    TransactionArgument(max(0, min(100, confidence)), _U8_SER),
+                    TransactionArgument(shelby_cid, _STR_SER),
+                ],
+            )
+            
+            signed_txn = await self.client.create_bcs_signed_transaction(
+                self.account,
+                TransactionPayload(payload),
+            )
+            
+            tx_hash = await self.client.submit_bcs_transaction(signed_txn)
+            await self.client.wait_for_transaction(tx_hash)
+            
+            print(f"[Aptos] ✓ Verdict updated! TX: {tx_hash}")
+            return tx_hash
+            
+        except Exception as e:
+            print(f"[Aptos] ✗ Error updating verdict: {e}")
+            return None
+    
     async def search_by_keyword(self, keyword: str) -> list[str]:
         """
         Search for claim hashes by keyword.
@@ -371,6 +465,17 @@ class SyncAptosVerdictClient:
             self._async_client.submit_verdict(chain_metadata, shelby_cid, verdict, confidence)
         )
     
+    def update_verdict(
+        self,
+        claim_hash: str,
+        verdict: str,
+        confidence: int,
+        shelby_cid: str,
+    ) -> Optional[str]:
+        return self._run(
+            self._async_client.update_verdict(claim_hash, verdict, confidence, shelby_cid)
+        )
+    
     def search_by_keyword(self, keyword: str) -> list[str]:
         return self._run(self._async_client.search_by_keyword(keyword))
 
@@ -405,6 +510,31 @@ def submit_verdict_to_chain(
     return client.submit_verdict(chain_metadata, shelby_cid, verdict, confidence)
 
 
+def update_shelby_cid_on_chain(
+    claim_hash: str,
+    verdict: str,
+    confidence: int,
+    shelby_cid: str,
+) -> Optional[str]:
+    """
+    Convenience function to attach a Shelby CID to an already-submitted verdict.
+    
+    Only the registry admin can do this (see AptosVerdictClient.update_verdict),
+    and it re-dates the verdict. Prefer submitting with the CID when possible.
+    
+    Args:
+        claim_hash: The claim hash of the submitted verdict.
+        verdict: Verdict string (unchanged from the original submission).
+        confidence: Confidence percentage (unchanged from the original submission).
+        shelby_cid: The Shelby CID for full report storage.
+        
+    Returns:
+        Transaction hash if successful, None otherwise.
+    """
+    client = SyncAptosVerdictClient()
+    return client.update_verdict(claim_hash, verdict, confidence, shelby_cid)
+
+
 def check_verdict_exists(claim_hash: str) -> bool:
     """
     Convenience function to check if verdict exists on-chain.
@@ -11,6 +11,7 @@ Implements the deduplication flow:
 """
 
 import os
+from operator import itemgetter
 from typing import Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
@@ -34,6 +35,7 @@ class CachedVerdict:
     relevance_score: float
     timestamp: int
     keywords_matched: list[str]
+    expiry: int = 0  # Unix timestamp (0 = never expires)
 
 
 class ChainLookupService:
@@ -166,16 +168,18 @@ Return ONLY a comma-separated list of scores in order (e.g., "0.9, 0.3, 0.7"):""
             ])
             
             scores_str = response.content.strip()
-            scores = [float(s.strip()) for s in scores_str.split(",")]
+            # float() already ignores surrounding whitespace
+            scores = [float(s) for s in scores_str.split(",")]
+            scores.extend([0.5] * (len(candidates) - len(scores)))
             
             # Pair with candidates
-            ranked = []
-            for i, (h, record, kw) in enumerate(candidates):
-                score = scores[i] if i < len(scores) else 0.5
-                ranked.append((h, record, kw, score))
+            ranked = [
+                (h, record, kw, score)
+                for (h, record, kw), score in zip(candidates, scores)
+            ]
             
             # Sort by relevance descending
-            ranked.sort(key=lambda x: x[3], reverse=True)
+            ranked.sort(key=itemgetter(3), reverse=True)
             return ranked
             
         except Exception as e:
@@ -275,6 +279,7 @@ Return ONLY a comma-separated list of scores in order (e.g., "0.9, 0.3, 0.7"):""
             relevance_score=relevance,
             timestamp=best_record.timestamp,
             keywords_matched=[best_keyword],
+            expiry=best_record.expiry,
         )
 
 
@@ -9,68 +9,83 @@ Verifies claims through:
 """
 
 import os
+import re
 import sys
+import random
+import atexit
 import time
 import logging
 import subprocess
+from logging.handlers import RotatingFileHandler
+from functools import lru_cache
 import shutil
+from contextlib import nullcontext
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.live import Live
-from rich.layout import Layout
-from rich.text import Text
-from rich.style import Style
-from rich.markdown import Markdown
 from rich import box
 
-# PDF Generation
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, mm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table as RLTable, 
-    TableStyle, HRFlowable, PageBreak, ListFlowable, ListItem,
-    KeepTogether, Image, Flowable
-)
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.graphics.shapes import Drawing, Rect, String, Wedge, Circle, Line
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics import renderPDF
-
 # Import agents from organized folder
-from agents import FactChecker, ForensicExpert, TheJudge, ClaimType
+from agents import FactChecker, ForensicExpert, TheJudge, generate_claim_hash
 
 # Import blockchain client
-from blockchain import submit_verdict_to_chain, check_verdict_exists, lookup_cached_verdict, CachedVerdict
+from blockchain import (
+    AptosVerdictClient,
+    submit_verdict_to_chain,
+    lookup_cached_verdict,
+    CachedVerdict,
+)
 
 # Initialize Rich console
 console = Console()
 
+# Boxed panels only on a real terminal; piped output (Modal logs, CI) gets plain text
+FANCY = console.is_terminal
+
+# Shelby CLI, resolved once at import (None if not installed)
+SHELBY_BIN = shutil.which("shelby")
+_SHELBY_URL_RE = re.compile(r"https://explorer\.shelby\.xyz/\S+")
+
+# Reports queued for one batched Shelby flush: (pdf_path, aep)
+_PENDING_UPLOADS: list[tuple[str, dict]] = []
+_UPLOAD_BATCH_SIZE = 8
+
+# Shared worker pool for overlapping independent pipeline steps
+_PIPELINE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="moveh")
+atexit.register(_PIPELINE_POOL.shutdown, wait=False)
+
+# How long the verdict submission waits for its report's Shelby upload (seconds)
+_CID_WAIT_SECONDS = 30.0
+
+# Head start given to the on-chain lookup before the agents are started (seconds)
+_CHAIN_LOOKUP_DEADLINE = float(os.getenv("MOVEH_LOOKUP_DEADLINE", "1.5"))
+
+# Caps on concurrent agent runs so batch verification stays under API rate limits.
+# The semaphores themselves are created per batch, on the event loop that uses them.
+_LLM_CONCURRENCY = int(os.getenv("MOVEH_LLM_CONCURRENCY", "4"))
+_SEARCH_CONCURRENCY = int(os.getenv("MOVEH_SEARCH_CONCURRENCY", "8"))
+
 
 # ============ Logging Configuration ============
 def setup_logging() -> logging.Logger:
-    """Configure logging with file handler."""
+    """Configure logging with a size-rotated file handler."""
     log_dir = os.path.join(os.path.dirname(__file__), "logs")
     os.makedirs(log_dir, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"sentinel_swarm_{timestamp}.log")
+    log_file = os.path.join(log_dir, "sentinel_swarm.log")
     
     logger = logging.getLogger("SentinelSwarm")
     logger.setLevel(logging.DEBUG)
     logger.handlers = []
     
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # One rolling log (10 MB x 5 backups) instead of a new file per run;
+    # delay=True defers opening the file until the first record is written
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=10_000_000, backupCount=5, encoding="utf-8", delay=True
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(
         "%(asctime)s | %(levelname)-8s | %(message)s",
@@ -90,40 +105,15 @@ logger, log_file = setup_logging()
 
 
 # ============ Input Validation ============
-def validate_claim(text: str) -> tuple[bool, str]:
-    """
-    Validate if the input is a claim statement, not a question.
-    
-    Args:
-        text: The user input to validate
-        
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    text = text.strip()
-    
-    # Check if empty
-    if not text:
-        return False, "Please enter a claim to verify."
-    
-    # Question indicators
-    question_starters = [
-        "what", "who", "where", "when", "why", "how", 
-        "is", "are", "was", "were", "will", "would", "could", "should",
-        "do", "does", "did", "can", "has", "have", "had",
-        "which", "whom", "whose"
-    ]
-    
-    first_word = text.lower().split()[0] if text.split() else ""
-    
-    # Check if starts with question word or ends with ?
-    is_question = (
-        text.endswith("?") or 
-        first_word in question_starters
-    )
-    
-    if is_question:
-        error_msg = """
+# Question indicators
+_QUESTION_STARTERS: frozenset[str] = frozenset({
+    "what", "who", "where", "when", "why", "how", 
+    "is", "are", "was", "were", "will", "would", "could", "should",
+    "do", "does", "did", "can", "has", "have", "had",
+    "which", "whom", "whose"
+})
+
+_ERROR_QUESTION_MSG = """
 [bold red]❌ Questions cannot be fact-checked![/bold red]
 
 MoveH verifies [bold]claim statements[/bold], not questions.
@@ -142,17 +132,74 @@ MoveH verifies [bold]claim statements[/bold], not questions.
 
 [dim]Tip: State the information as if it were a fact, and we'll verify it![/dim]
 """
-        return False, error_msg
+
+
+def validate_claim(text: str) -> tuple[bool, str]:
+    """
+    Validate if the input is a claim statement, not a question.
+    
+    Args:
+        text: The user input to validate
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    text = text.strip()
+    
+    # Check if empty
+    if not text:
+        return False, "Please enter a claim to verify."
+    
+    # Trailing "?" is the common rejection, so check it before tokenizing
+    if text.endswith("?"):
+        return False, _ERROR_QUESTION_MSG
+    
+    tokens = text.split()
+    
+    # Check if starts with question word
+    if tokens[0].lower() in _QUESTION_STARTERS:
+        return False, _ERROR_QUESTION_MSG
     
     # Check minimum length (at least 3 words for a meaningful claim)
-    word_count = len(text.split())
+    word_count = len(tokens)
     if word_count < 3:
         return False, "[yellow]Claim too short. Please provide more details.[/yellow]"
     
     return True, ""
 
 
+@lru_cache(maxsize=128)
+def _validate_claim_cached(normalized: str) -> tuple[bool, str]:
+    """validate_claim memoized on a lowercased, whitespace-collapsed claim."""
+    return validate_claim(normalized)
+
+
 # ============ UI Helper Functions ============
+# (color, icon, display) indexed by _verdict_style: uncertain, likely true, likely false
+_VERDICT_STYLES = (
+    lambda p: ("yellow", "⚠️", f"Uncertain ({p:.0f}%)"),
+    lambda p: ("green", "✅", f"{p:.0f}% likely TRUE"),
+    lambda p: ("red", "❌", f"{100-p:.0f}% likely FALSE"),
+)
+
+
+def _verdict_style(truth_prob: float) -> tuple[str, str, str]:
+    """Return (color, icon, display text) for a truth probability."""
+    idx = (truth_prob >= 60) + 2 * (truth_prob <= 40)
+    return _VERDICT_STYLES[idx](truth_prob)
+
+
+def _panel(body, title: str | None = None, **panel_kwargs):
+    """A Rich Panel on a terminal, or just its text when output is piped (skips panel layout)."""
+    if FANCY:
+        return Panel(body, title=title, **panel_kwargs)
+    return f"{title}\n{body}" if title else body
+
+
+# Integrity score bars indexed by filled cells (0-20)
+_SCORE_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+
 def print_header():
     """Print the application header."""
     header = """
@@ -166,7 +213,7 @@ def print_header():
 
 def print_claim_box(claim: str):
     """Print the claim being analyzed."""
-    console.print(Panel(
+    console.print(_panel(
         f"[bold white]{claim}[/bold white]",
         title="[bold yellow]📋 Claim to Verify[/bold yellow]",
         border_style="yellow",
@@ -174,29 +221,62 @@ def print_claim_box(claim: str):
     ))
 
 
-def create_spinner_status(message: str):
-    """Create a progress spinner for status updates."""
-    return Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        transient=True,
-        console=console
-    )
+class SwarmProgress:
+    """One live spinner display tracking the chain lookup and all three agents through a verification."""
+    
+    def __init__(self):
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            transient=True,
+            console=console
+        )
+        self.chain_task = self.progress.add_task("⛓️ Blockchain: Searching for cached verdict...", total=None)
+        self.fc_task = self.progress.add_task("🔍 Fact Checker: Searching evidence...", total=None)
+        self.fe_task = self.progress.add_task("🕵️ Forensic Expert: Analyzing text...", total=None)
+        self.judge_task = self.progress.add_task("⚖️ The Judge: Waiting for evidence...", total=None, start=False)
+    
+    def __enter__(self) -> "SwarmProgress":
+        self.progress.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.progress.stop()
+    
+    def update(self, task_id, description: str):
+        """Change a task's status line."""
+        self.progress.start_task(task_id)
+        self.progress.update(task_id, description=description)
+    
+    def complete(self, task_id, description: str):
+        """Mark a task finished, leaving its final status on screen."""
+        self.progress.update(task_id, description=f"[green]✓ {description}", total=1, completed=1)
 
 
-def run_with_spinner(message: str, func, *args, **kwargs):
-    """Run a function with a spinner animation."""
-    with create_spinner_status(message) as progress:
-        task = progress.add_task(message, total=None)
-        result = func(*args, **kwargs)
-        progress.remove_task(task)
-    return result
+class PipelineProgress:
+    """A single status spinner shared by consecutive pipeline stages."""
+    
+    def __init__(self, message: str):
+        self._status = console.status(message, spinner="dots")
+    
+    def __enter__(self) -> "PipelineProgress":
+        self._status.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._status.stop()
+    
+    def stage(self, message: str):
+        """Relabel the spinner for the next stage."""
+        self._status.update(message)
 
 
 def print_agent_header(agent_num: int, agent_name: str, icon: str, color: str):
     """Print an agent section header."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         f"[bold {color}]{icon} {agent_name}[/bold {color}]",
         border_style=color,
         box=box.DOUBLE
@@ -249,8 +329,8 @@ def print_forensic_results(forensic_log: dict):
         score_color = "red"
     
     # Score bar
-    filled = int(score * 20)
-    bar = "█" * filled + "░" * (20 - filled)
+    filled = min(max(int(score * 20), 0), 20)
+    bar = _SCORE_BARS[filled]
     
     # Results table
     table = Table(show_header=False, box=box.ROUNDED, border_style="magenta")
@@ -274,7 +354,6 @@ def print_forensic_results(forensic_log: dict):
 def print_judge_results(aep: dict):
     """Print The Judge (Agent 3) final verdict with probability language."""
     verdict_data = aep.get("verdict", {})
-    verdict = verdict_data.get("decision", "UNKNOWN")
     score = verdict_data.get("confidence_score", 0)
     truth_prob = verdict_data.get("truth_probability", 50)
     verdict_text = verdict_data.get("verdict_text", "")
@@ -288,35 +367,9 @@ def print_judge_results(aep: dict):
     freshness_hours = chain_meta.get("freshness_hours", 0)
     
     # Probability-based styling
-    if truth_prob >= 60:
-        color = "green"
-        icon = "✅"
-        prob_display = f"{truth_prob:.0f}% likely TRUE"
-    elif truth_prob <= 40:
-        color = "red"
-        icon = "❌"
-        prob_display = f"{100-truth_prob:.0f}% likely FALSE"
-    else:
-        color = "yellow"
-        icon = "⚠️"
-        prob_display = f"Uncertain ({truth_prob:.0f}%)"
-    
-    # Final verdict panel with probability
-    console.print()
-    console.print(Panel(
-        f"[bold {color}]{icon}  {prob_display}[/bold {color}]\n\n"
-        f"[dim]{verdict_text}[/dim]",
-        title="[bold]⚖️ VERDICT[/bold]",
-        border_style=color,
-        padding=(1, 3)
-    ))
-    
-    # Summary reasoning
-    console.print("\n[bold cyan]Summary:[/bold cyan]")
-    console.print(Panel(reasoning, border_style="dim", padding=(0, 2)))
+    color, icon, prob_display = _verdict_style(truth_prob)
     
     # Chain metadata info
-    console.print("\n[bold magenta]🔗 Chain Metadata:[/bold magenta]")
     meta_table = Table(show_header=False, box=box.SIMPLE, border_style="dim")
     meta_table.add_column("Key", style="cyan")
     meta_table.add_column("Value", style="white")
@@ -337,11 +390,26 @@ def print_judge_results(aep: dict):
     full_hash = chain_meta.get('claim_hash', 'N/A')
     meta_table.add_row("Claim Hash", f"[cyan]{full_hash}[/cyan]")
     
-    console.print(meta_table)
-    
-    # Confidence info
-    console.print(f"\n[dim]Confidence: {score:.0%} ({confidence})[/dim]")
-    console.print(f"[dim]🔗 Report ID: {aep.get('claim_id', 'N/A')}[/dim]")
+    # Render everything in a single write
+    console.print(Group(
+        "",
+        # Final verdict panel with probability
+        _panel(
+            f"[bold {color}]{icon}  {prob_display}[/bold {color}]\n\n"
+            f"[dim]{verdict_text}[/dim]",
+            title="[bold]⚖️ VERDICT[/bold]",
+            border_style=color,
+            padding=(1, 3)
+        ),
+        # Summary reasoning
+        "\n[bold cyan]Summary:[/bold cyan]",
+        _panel(reasoning, border_style="dim", padding=(0, 2)),
+        "\n[bold magenta]🔗 Chain Metadata:[/bold magenta]",
+        meta_table,
+        # Confidence info
+        f"\n[dim]Confidence: {score:.0%} ({confidence})[/dim]",
+        f"[dim]🔗 Report ID: {aep.get('claim_id', 'N/A')}[/dim]",
+    ))
 
 
 def print_summary(aep: dict, elapsed_time: float):
@@ -349,435 +417,45 @@ def print_summary(aep: dict, elapsed_time: float):
     verdict_data = aep.get("verdict", {})
     truth_prob = verdict_data.get("truth_probability", 50)
     
-    if truth_prob >= 60:
-        color, icon = "green", "✅"
-        verdict_display = f"{truth_prob:.0f}% likely TRUE"
-    elif truth_prob <= 40:
-        color, icon = "red", "❌"
-        verdict_display = f"{100-truth_prob:.0f}% likely FALSE"
-    else:
-        color, icon = "yellow", "⚠️"
-        verdict_display = f"Uncertain ({truth_prob:.0f}%)"
-    
-    console.print()
-    console.print(Panel(
-        f"[bold white]Analysis Complete[/bold white]\n\n"
-        f"Verdict: [bold {color}]{icon} {verdict_display}[/bold {color}]\n"
-        f"Processing Time: [cyan]{elapsed_time:.1f}s[/cyan]\n"
-        f"Log File: [dim]{log_file}[/dim]",
-        title="[bold green]✅ Summary[/bold green]",
-        border_style="green",
-        padding=(1, 2)
+    color, icon, verdict_display = _verdict_style(truth_prob)
+    
+    console.print(Group(
+        "",
+        _panel(
+            f"[bold white]Analysis Complete[/bold white]\n\n"
+            f"Verdict: [bold {color}]{icon} {verdict_display}[/bold {color}]\n"
+            f"Processing Time: [cyan]{elapsed_time:.1f}s[/cyan]\n"
+            f"Log File: [dim]{log_file}[/dim]",
+            title="[bold green]✅ Summary[/bold green]",
+            border_style="green",
+            padding=(1, 2)
+        ),
     ))
 
 
 # ============ PDF Report Generation ============
-
-class ConfidenceGauge(Flowable):
-    """Custom flowable for semi-circle confidence gauge."""
-    def __init__(self, percentage, color, width=120, height=60):
-        Flowable.__init__(self)
-        self.percentage = percentage
-        self.color = color
-        self.width = width
-        self.height = height
-
-    def wrap(self, availWidth, availHeight):
-        # This tells the Table exactly how much space to reserve
-        return self.width, self.height
-
-    def draw(self):
-        from reportlab.lib.colors import HexColor
-        
-        # Center the drawing in the available space
-        cx = self.width / 2
-        cy = 5  # Bottom padding
-        radius = min(self.width / 2, self.height) - 5
-        
-        # Background arc (darker gray for contrast with white progress)
-        self.canv.setLineWidth(12)
-        self.canv.setStrokeColor(HexColor('#6b7280'))
-        self.canv.setFillColor(colors.transparent)
-        # arc(x1, y1, x2, y2, startAng, extent)
-        self.canv.arc(cx - radius, cy - radius, cx + radius, cy + radius, 0, 180)
-        
-        # Foreground arc (white progress on dark background)
-        angle = 180 * (self.percentage / 100)
-        self.canv.setStrokeColor(self.color)
-        self.canv.arc(cx - radius, cy - radius, cx + radius, cy + radius, 180 - angle, angle)
-        
-        # Percentage Text
-        self.canv.setFillColor(HexColor('#ffffff')) # White text looks better on colored headers
-        self.canv.setFont('Helvetica-Bold', 14)
-        self.canv.drawCentredString(cx, cy + 5, f"{self.percentage:.0f}%")
-
-class DonutChart(Flowable):
-    """Custom flowable for donut chart."""
-    def __init__(self, percentage, color, size=50, label=""):
-        Flowable.__init__(self)
-        self.percentage = percentage
-        self.color = color
-        self.size = size
-        self.label = label
-        self.width = size
-        self.height = size + 15 # Reserve space for label
-
-    def wrap(self, availWidth, availHeight):
-        return self.width, self.height
-
-    def draw(self):
-        from reportlab.lib.colors import HexColor
-        
-        cx = self.width / 2
-        cy = self.height - (self.size / 2) # Top aligned
-        radius = self.size / 2
-        inner_radius = radius * 0.6
-        
-        # Background circle
-        self.canv.setFillColor(HexColor('#e2e8f0'))
-        self.canv.setStrokeColor(colors.transparent)
-        self.canv.circle(cx, cy, radius, fill=1, stroke=0)
-        
-        # Wedge (Foreground)
-        if self.percentage > 0:
-            self.canv.setFillColor(self.color)
-            angle = 360 * (self.percentage / 100)
-            p = self.canv.beginPath()
-            p.moveTo(cx, cy)
-            # arcTo draws a curve. simplified wedge approach:
-            p.arc(cx - radius, cy - radius, cx + radius, cy + radius, 90, angle) 
-            p.lineTo(cx, cy)
-            p.close()
-            self.canv.drawPath(p, fill=1, stroke=0)
-        
-        # Inner white circle (Donut hole)
-        self.canv.setFillColor(colors.white)
-        self.canv.circle(cx, cy, inner_radius, fill=1, stroke=0)
-        
-        # Center Value
-        self.canv.setFillColor(HexColor('#0f172a'))
-        self.canv.setFont('Helvetica-Bold', 9)
-        self.canv.drawCentredString(cx, cy - 3, f"{self.percentage:.0f}%")
-        
-        # Bottom Label
-        if self.label:
-            self.canv.setFont('Helvetica', 8)
-            self.canv.setFillColor(HexColor('#64748b'))
-            self.canv.drawCentredString(cx, 0, self.label)
-
-
 def generate_pdf_report(claim: str, a1_result: dict, a2_result: dict, aep: dict) -> str:
     """Generate a professional PDF report with visual elements."""
+    # Imported lazily: ReportLab is only needed once a report is rendered
+    from pdf_report import generate_pdf_report as render_pdf_report
+    return render_pdf_report(claim, a1_result, a2_result, aep)
+
+
+def generate_pdf_report_async(claim: str, a1_result: dict, a2_result: dict, aep: dict) -> Future:
+    """
+    Render the PDF report on the pipeline thread pool.
     
-    reports_dir = os.path.join(os.path.dirname(__file__), "reports")
-    os.makedirs(reports_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    pdf_path = os.path.join(reports_dir, f"moveh_report_{timestamp}.pdf")
+    The CLI renders one report per run, so a worker process would only add
+    start-up cost (and, under spawn, re-import this module and its agents).
     
-    try:
-        # Create document
-        doc = SimpleDocTemplate(
-            pdf_path,
-            pagesize=A4,
-            rightMargin=40,
-            leftMargin=40,
-            topMargin=40,
-            bottomMargin=40
-        )
-        
-        # Colors
-        DARK = colors.HexColor('#0f172a')
-        GRAY_700 = colors.HexColor('#334155')
-        GRAY_600 = colors.HexColor('#475569')
-        GRAY_500 = colors.HexColor('#64748b')
-        GRAY_200 = colors.HexColor('#e2e8f0')
-        GRAY_50 = colors.HexColor('#f8fafc')
-        BLUE = colors.HexColor('#3b82f6')
-        GREEN = colors.HexColor('#10b981')
-        RED = colors.HexColor('#ef4444')
-        AMBER = colors.HexColor('#f59e0b')
-        WHITE = colors.white
-        
-        # Get verdict data
-        verdict_data = aep.get("verdict", {})
-        truth_prob = verdict_data.get("truth_probability", 50)
-        
-        if truth_prob >= 60:
-            verdict_bg = colors.HexColor('#059669')
-            stamp_text = "TRUE"
-            gauge_pct = truth_prob
-        elif truth_prob <= 40:
-            verdict_bg = colors.HexColor('#dc2626')
-            stamp_text = "FALSE"
-            gauge_pct = 100 - truth_prob
-        else:
-            verdict_bg = colors.HexColor('#d97706')
-            stamp_text = "UNCERTAIN"
-            gauge_pct = 50
-        
-        content = []
-        
-        # ═══════════════════════════════════════════════════════════════
-        # 1. VERDICT HERO SECTION
-        # ═══════════════════════════════════════════════════════════════
-        
-        gauge = ConfidenceGauge(gauge_pct, WHITE, width=80, height=45)
-        
-        hero_content = [
-            [gauge],
-            [Paragraph(f"{stamp_text}", ParagraphStyle(
-                'Stamp', fontSize=28, textColor=WHITE, fontName='Helvetica-Bold', 
-                alignment=TA_CENTER, leading=32, spaceBefore=2
-            ))],
-            [Paragraph(f"{gauge_pct:.0f}% confidence", ParagraphStyle(
-                'Sub', fontSize=10, textColor=WHITE, alignment=TA_CENTER
-            ))]
-        ]
-        
-        hero_table = RLTable(hero_content, colWidths=[doc.width])
-        hero_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), verdict_bg),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, -1), (-1, -1), 12),
-        ]))
-        content.append(hero_table)
-        content.append(Spacer(1, 15))
-        
-        # Header Info
-        header_row = [[
-            Paragraph("MOVEH", ParagraphStyle('Logo', fontSize=10, textColor=GRAY_600, fontName='Helvetica-Bold')),
-            Paragraph(f"{datetime.now().strftime('%B %d, %Y')}", ParagraphStyle('Date', fontSize=10, textColor=GRAY_500, alignment=TA_RIGHT))
-        ]]
-        content.append(RLTable(header_row, colWidths=[doc.width/2, doc.width/2]))
-        content.append(HRFlowable(width="100%", thickness=1, color=GRAY_200, spaceAfter=15))
-        
-        # ═══════════════════════════════════════════════════════════════
-        # 2. CLAIM vs REALITY
-        # ═══════════════════════════════════════════════════════════════
-        
-        reasoning = aep.get("reasoning", "Analysis in progress...")
-        claim_short = claim[:200] + "..." if len(claim) > 200 else claim
-        
-        style_rumor = ParagraphStyle('Rumor', fontSize=11, leading=15, textColor=GRAY_700)
-        style_reality = ParagraphStyle('Reality', fontSize=10, leading=14, textColor=GRAY_600)
-        
-        rumor_content = [
-            [Paragraph("THE CLAIM", ParagraphStyle('H1', fontSize=8, textColor=GRAY_500))],
-            [Paragraph(f'"{claim_short}"', style_rumor)]
-        ]
-        
-        reality_content = [
-            [Paragraph("THE REALITY", ParagraphStyle('H2', fontSize=8, textColor=BLUE))],
-            [Paragraph(str(reasoning), style_reality)]
-        ]
-        
-        col_w = doc.width * 0.48
-        
-        t_rumor = RLTable(rumor_content, colWidths=[col_w - 12])
-        t_rumor.setStyle(TableStyle([
-            ('BOX', (0, 0), (-1, -1), 1, GRAY_200),
-            ('BACKGROUND', (0, 0), (-1, -1), GRAY_50),
-            ('PADDING', (0, 0), (-1, -1), 6),
-        ]))
-        
-        t_reality = RLTable(reality_content, colWidths=[col_w - 12])
-        t_reality.setStyle(TableStyle([
-            ('BOX', (0, 0), (-1, -1), 1, GRAY_200),
-            ('PADDING', (0, 0), (-1, -1), 6),
-        ]))
-        
-        main_claim_table = RLTable([[t_rumor, t_reality]], colWidths=[col_w, col_w])
-        main_claim_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ]))
-        content.append(main_claim_table)
-        content.append(Spacer(1, 20))
-
-        # ═══════════════════════════════════════════════════════════════
-        # 3. METRICS - SIMPLIFIED (no custom flowables that may cause issues)
-        # ═══════════════════════════════════════════════════════════════
-        
-        integrity = a2_result.get("integrity_score", 0) * 100
-        ai_prob = a2_result.get("detection_summary", {}).get("ai_probability", 0) * 100
-        sources_count = sum(len(sr.get("results", [])) for sr in a1_result.get("search_results", []) if isinstance(sr, dict))
-        red_flags = len(a2_result.get("penalties_applied", []))
-
-        # Simple text-based metrics (more reliable than custom flowables)
-        int_color = GREEN if integrity >= 70 else (AMBER if integrity >= 40 else RED)
-        ai_color = RED if ai_prob >= 70 else (AMBER if ai_prob >= 40 else GREEN)
-        
-        metrics_row = [[
-            Paragraph(f"<b>🛡️ Integrity</b><br/><font size='14' color='{int_color.hexval()}'>{integrity:.0f}%</font>", 
-                ParagraphStyle('M1', fontSize=8, alignment=TA_CENTER, leading=16)),
-            Paragraph(f"<b>🤖 AI Prob</b><br/><font size='14' color='{ai_color.hexval()}'>{ai_prob:.0f}%</font>", 
-                ParagraphStyle('M2', fontSize=8, alignment=TA_CENTER, leading=16)),
-            Paragraph(f"<b>🔗 Sources</b><br/><font size='14'>{sources_count}</font>", 
-                ParagraphStyle('M3', fontSize=8, alignment=TA_CENTER, leading=16)),
-            Paragraph(f"<b>🚩 Red Flags</b><br/><font size='14' color='#ef4444'>{red_flags}</font>", 
-                ParagraphStyle('M4', fontSize=8, alignment=TA_CENTER, leading=16)),
-        ]]
-        
-        metrics_table = RLTable(metrics_row, colWidths=[doc.width/4]*4)
-        metrics_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 0), (-1, -1), GRAY_50),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, WHITE),
-        ]))
-        content.append(metrics_table)
-        content.append(Spacer(1, 20))
-
-        # ═══════════════════════════════════════════════════════════════
-        # 3.5 CHAIN METADATA (NEW)
-        # ═══════════════════════════════════════════════════════════════
-        
-        chain_meta = aep.get("chain_metadata", {})
-        keywords = chain_meta.get("keywords", [])
-        claim_type_name = chain_meta.get("claim_type_name", "UNKNOWN")
-        freshness_hours = chain_meta.get("freshness_hours", 0)
-        claim_hash_short = chain_meta.get("claim_hash", "N/A")[:16] + "..."
-        
-        # Format freshness
-        if freshness_hours == 0:
-            freshness_text = "Never expires"
-            freshness_color = GREEN
-        elif freshness_hours <= 24:
-            freshness_text = f"{freshness_hours} hours"
-            freshness_color = RED
-        else:
-            freshness_text = f"{freshness_hours // 24} days"
-            freshness_color = AMBER
-        
-        content.append(Paragraph("ON-CHAIN METADATA", ParagraphStyle('ChainHead', fontSize=10, fontName='Helvetica-Bold', spaceAfter=8, textColor=GRAY_700)))
-        
-        chain_data = [
-            ["Keywords", ", ".join(keywords) if keywords else "N/A"],
-            ["Claim Type", claim_type_name],
-            ["Freshness", freshness_text],
-            ["Claim Hash", claim_hash_short],
-        ]
-        
-        chain_table = RLTable(chain_data, colWidths=[doc.width * 0.25, doc.width * 0.75])
-        chain_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), GRAY_50),
-            ('TEXTCOLOR', (0, 0), (0, -1), GRAY_600),
-            ('TEXTCOLOR', (1, 0), (1, -1), GRAY_700),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, GRAY_200),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        content.append(chain_table)
-        content.append(Spacer(1, 20))
-
-        # ═══════════════════════════════════════════════════════════════
-        # 4. SOURCES & FLAGS
-        # ═══════════════════════════════════════════════════════════════
-        
-        content.append(Paragraph("EVIDENCE & ANALYSIS", ParagraphStyle('Head', fontSize=12, fontName='Helvetica-Bold', spaceAfter=10)))
-        
-        search_results = a1_result.get("search_results", [])
-        
-        # Create Cards
-        for i, sr in enumerate(search_results):
-            results_list = sr.get("results", []) if isinstance(sr, dict) else []
-            for result in results_list:  # Show all sources
-                if not isinstance(result, dict):
-                    continue
-                
-                title = str(result.get("title", "Source"))[:80]
-                url = str(result.get("url", ""))
-                content_text = str(result.get("content", ""))[:150]
-                
-                try:
-                    domain = url.split('/')[2].replace('www.', '') if len(url.split('/')) > 2 else "Web"
-                except:
-                    domain = "Web"
-                
-                # Badge Color
-                badge_text = "SOURCE"
-                badge_bg = GRAY_200
-                badge_fg = GRAY_700
-                if 'gov' in url: badge_text, badge_bg, badge_fg = "OFFICIAL", colors.HexColor('#dcfce7'), GREEN
-                elif 'reuters' in url or 'apnews' in url: badge_text, badge_bg, badge_fg = "NEWS", colors.HexColor('#dbeafe'), BLUE
-
-                # Source Card Layout
-                card_content = [
-                    [
-                        Paragraph(f"<b>{title}</b>", ParagraphStyle('ST', fontSize=9)),
-                        Paragraph(f"{badge_text}", ParagraphStyle('Badg', fontSize=6, backColor=badge_bg, textColor=badge_fg, alignment=TA_CENTER, borderPadding=2))
-                    ],
-                    [
-                        Paragraph(f"<font color='#64748b'>{content_text}...</font>", ParagraphStyle('Snip', fontSize=8, leading=10)),
-                        ""
-                    ],
-                    [
-                        Paragraph(f"🔗 {domain}", ParagraphStyle('Dom', fontSize=7, textColor=BLUE)),
-                        ""
-                    ]
-                ]
-                
-                # Adjusted column widths to prevent badge overlap (80% / 20%)
-                card = RLTable(card_content, colWidths=[doc.width * 0.8, doc.width * 0.15])
-                card.setStyle(TableStyle([
-                    ('BOX', (0, 0), (-1, -1), 0.5, GRAY_200),
-                    ('SPAN', (0, 1), (1, 1)),  # Span snippet across
-                    ('SPAN', (0, 2), (1, 2)),  # Span domain across
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),  # Right align badge
-                ]))
-                
-                content.append(KeepTogether(card))  # Prevent page breaks inside card
-                content.append(Spacer(1, 6))
-        
-        # Red Flags at bottom
-        penalties = a2_result.get("penalties_applied", [])
-        if penalties:
-            content.append(Spacer(1, 10))
-            content.append(Paragraph("Risk Indicators:", ParagraphStyle('Risk', fontSize=9, fontName='Helvetica-Bold')))
-            
-            flag_text = ""
-            for name, score in penalties:
-                flag_text += f'&nbsp;&nbsp;<font color="#ef4444">●</font> {name} '
-                
-            content.append(Paragraph(flag_text, ParagraphStyle('Flags', fontSize=9, textColor=GRAY_700, leading=14)))
-
-        # Footer
-        content.append(Spacer(1, 30))
-        chain_meta = aep.get("chain_metadata", {})
-        footer_text = f"Report ID: {aep.get('claim_id', 'N/A')} | Type: {chain_meta.get('claim_type_name', 'N/A')} | Generated via MoveH AI"
-        content.append(Paragraph(footer_text, 
-                                 ParagraphStyle('Foot', fontSize=7, textColor=GRAY_500, alignment=TA_CENTER)))
-
-        doc.build(content)
-        return pdf_path
-    
-    except Exception as e:
-        # Fallback: Create a simple PDF if the fancy one fails
-        logger.error(f"PDF generation error: {e}")
-        
-        doc = SimpleDocTemplate(pdf_path, pagesize=A4)
-        content = [
-            Paragraph("MoveH Fact-Check Report", ParagraphStyle('Title', fontSize=24, spaceAfter=20)),
-            Paragraph(f"Claim: {claim}", ParagraphStyle('Claim', fontSize=12, spaceAfter=10)),
-            Paragraph(f"Verdict: {aep.get('verdict', {}).get('decision', 'UNKNOWN')}", ParagraphStyle('Verdict', fontSize=14, spaceAfter=10)),
-            Paragraph(f"Reasoning: {aep.get('reasoning', 'N/A')}", ParagraphStyle('Reasoning', fontSize=10)),
-        ]
-        doc.build(content)
-        return pdf_path
+    Returns:
+        Future resolving to the PDF path.
+    """
+    return _PIPELINE_POOL.submit(generate_pdf_report, claim, a1_result, a2_result, aep)
 
 
 # ============ Shelby Storage Integration ============
-def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
+async def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
     """
     Upload PDF report to Shelby decentralized storage.
     
@@ -789,7 +467,7 @@ def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
         dict with upload status, explorer URL, etc.
     """
     # Check if Shelby CLI is installed
-    if not shutil.which("shelby"):
+    if not SHELBY_BIN:
         logger.warning("Shelby CLI not installed. Install with: npm i -g @shelby-protocol/cli")
         return {
             "success": False,
@@ -804,7 +482,7 @@ def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
         
         # Upload to Shelby with auto-confirm
         cmd = [
-            "shelby", "upload",
+            SHELBY_BIN, "upload",
             pdf_path,
             blob_name,
             "-e", expiry,
@@ -812,27 +490,30 @@ def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
         ]
         
         logger.info(f"Uploading to Shelby: {blob_name}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60  # 60 second timeout
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
         
-        if result.returncode == 0:
-            # Parse output for explorer URL
-            output = result.stdout
-            explorer_url = None
-            
-            # Try to extract Shelby Explorer URL from output
-            for line in output.split("\n"):
-                if "explorer.shelby.xyz" in line:
-                    # Extract URL
-                    import re
-                    urls = re.findall(r'https://explorer\.shelby\.xyz/[^\s]+', line)
-                    if urls:
-                        explorer_url = urls[0]
-                        break
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)  # 60 second timeout
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error("Shelby upload timed out")
+            return {"success": False, "error": "Upload timed out"}
+        except asyncio.CancelledError:
+            # Caller gave up on the upload; don't leave the CLI running
+            proc.kill()
+            raise
+        
+        output = stdout.decode(errors="replace")
+        
+        if proc.returncode == 0:
+            # One scan of the whole output for the Shelby Explorer URL
+            m = _SHELBY_URL_RE.search(output)
+            explorer_url = m.group(0) if m else None
             
             logger.info(f"Shelby upload successful: {blob_name}")
             return {
@@ -843,51 +524,360 @@ def upload_to_shelby(pdf_path: str, expiry: str = "in 30 days") -> dict:
                 "output": output
             }
         else:
-            error_msg = result.stderr or result.stdout
+            error_msg = stderr.decode(errors="replace") or output
             logger.error(f"Shelby upload failed: {error_msg}")
             return {
                 "success": False,
                 "error": error_msg
             }
             
-    except subprocess.TimeoutExpired:
-        logger.error("Shelby upload timed out")
-        return {"success": False, "error": "Upload timed out"}
     except Exception as e:
         logger.error(f"Shelby upload error: {e}")
         return {"success": False, "error": str(e)}
 
 
+def flush_shelby_uploads() -> list[dict]:
+    """
+    Upload all queued reports to Shelby concurrently, then attach each CID on-chain.
+    
+    Only registry-admin runs queue reports (see publish_verdict), since attaching
+    a CID after submission is an admin-only update.
+    
+    Returns:
+        Upload results, in queue order.
+    """
+    if not _PENDING_UPLOADS:
+        return []
+    
+    pending = _PENDING_UPLOADS[:]
+    _PENDING_UPLOADS.clear()
+    
+    async def upload_and_attach() -> list[dict]:
+        results = await asyncio.gather(*(upload_to_shelby(path, expiry="in 30 days") for path, _ in pending))
+        
+        to_attach = [
+            (aep, result["blob_name"])
+            for (_, aep), result in zip(pending, results)
+            if result.get("success") and aep.get("storage", {}).get("aptos_tx")
+        ]
+        if to_attach:
+            # One client (and HTTP pool) for every CID update in the flush
+            try:
+                async with AptosVerdictClient() as client:
+                    for aep, blob_name in to_attach:
+                        await attach_shelby_cid(client, aep, blob_name)
+            except Exception as e:
+                logger.error(f"Aptos CID update error: {e}")
+        return results
+    
+    with console.status(f"[bold magenta]☁️ Uploading {len(pending)} report(s) to Shelby...", spinner="dots"):
+        results = asyncio.run(upload_and_attach())
+    
+    uploaded = sum(1 for r in results if r.get("success"))
+    console.print(f"[dim]☁️ Shelby: {uploaded}/{len(pending)} queued report(s) uploaded[/dim]")
+    return results
+
+
+# ============ Verdict Cache ============
+_VERDICT_CACHE_SIZE = 512
+_verdict_cache: dict[str, CachedVerdict] = {}
+
+
+def cached_lookup(claim: str, claim_hash: str) -> CachedVerdict | None:
+    """
+    Look up an existing on-chain verdict, memoized in-process by claim hash.
+    
+    Only fresh verdicts are cached, and an entry is dropped once its on-chain
+    expiry has passed, so repeat claims skip the chain lookup entirely.
+    """
+    cached = _verdict_cache.pop(claim_hash, None)
+    if cached is not None and (not cached.expiry or cached.expiry > time.time()):
+        _verdict_cache[claim_hash] = cached  # Re-insert as most recently used
+        return cached
+    
+    verdict = lookup_cached_verdict(claim)
+    if verdict and verdict.is_fresh:
+        if len(_verdict_cache) >= _VERDICT_CACHE_SIZE:
+            del _verdict_cache[next(iter(_verdict_cache))]  # Evict least recently used
+        _verdict_cache[claim_hash] = verdict
+    return verdict
+
+
+# ============ Aptos Submission ============
+def submit_aep_to_chain(aep: dict, shelby_cid: str) -> str | None:
+    """
+    Submit the Judge's verdict to the Aptos blockchain.
+    
+    Args:
+        aep: The Audit Evidence Package from The Judge
+        shelby_cid: Shelby blob name of the uploaded report ("" if not uploaded)
+    
+    Returns:
+        Transaction hash if submitted, None otherwise.
+    """
+    chain_metadata = aep.get("chain_metadata", {})
+    if not chain_metadata.get("claim_hash"):
+        return None
+    
+    verdict_data = aep.get("verdict") or {}
+    verdict_decision = verdict_data.get("decision", "UNCERTAIN")
+    confidence_score = int(verdict_data.get("truth_probability", 50))
+    
+    try:
+        aptos_tx_hash = submit_verdict_to_chain(
+            chain_metadata=chain_metadata,
+            shelby_cid=shelby_cid,
+            verdict=verdict_decision,
+            confidence=confidence_score,
+        )
+    except Exception as e:
+        logger.error(f"Aptos submission error: {e}")
+        return None
+    
+    if aptos_tx_hash:
+        logger.info(f"Aptos submission successful: {aptos_tx_hash}")
+    else:
+        logger.warning("Aptos submission failed - no transaction hash returned")
+    return aptos_tx_hash
+
+
+async def attach_shelby_cid(client: AptosVerdictClient, aep: dict, shelby_cid: str) -> str | None:
+    """
+    Attach a Shelby blob name to a verdict already submitted without one.
+    
+    Uses update_verdict, which only the registry admin may call and which also
+    re-dates the record on-chain to the time of the update.
+    
+    Returns:
+        Transaction hash if updated, None otherwise.
+    """
+    claim_hash = aep.get("chain_metadata", {}).get("claim_hash")
+    if not claim_hash:
+        return None
+    
+    verdict_data = aep.get("verdict", {})
+    tx_hash = await client.update_verdict(
+        claim_hash,
+        verdict_data.get("decision", "UNCERTAIN"),
+        int(verdict_data.get("truth_probability", 50)),
+        shelby_cid,
+    )
+    
+    if tx_hash:
+        logger.info(f"Shelby CID attached on-chain: {tx_hash}")
+    else:
+        logger.warning("Shelby CID update failed - verdict stays without a CID")
+    return tx_hash
+
+
+async def publish_verdict(
+    aep: dict, pdf_path: str, defer_upload: bool = False
+) -> tuple[str | None, dict | None, bool]:
+    """
+    Upload the report to Shelby, then submit the verdict to Aptos with its CID.
+    
+    The CID goes out in the submit transaction itself, so no follow-up
+    update_verdict is needed. The upload is bounded by _CID_WAIT_SECONDS for
+    every signer; if it times out or fails, the verdict goes out without a CID.
+    
+    With defer_upload, a registry-admin signer submits right away and leaves
+    the upload to flush_shelby_uploads, which attaches the CID afterwards.
+    Other signers can't attach it later, so they upload inline regardless.
+    
+    Returns:
+        (aptos_tx_hash, shelby_result, deferred); shelby_result is None if the
+        upload timed out or was deferred.
+    """
+    chain_metadata = aep.get("chain_metadata") or {}
+    client = None
+    if chain_metadata.get("claim_hash"):
+        try:
+            client = AptosVerdictClient()
+        except Exception as e:
+            logger.error(f"Aptos submission error: {e}")
+    
+    deferred = defer_upload and client is not None and client.is_admin
+    shelby_result = None
+    shelby_cid = ""
+    if not deferred:
+        try:
+            shelby_result = await asyncio.wait_for(
+                upload_to_shelby(pdf_path, expiry="in 30 days"), timeout=_CID_WAIT_SECONDS
+            )
+        except TimeoutError:
+            pass
+        
+        if shelby_result and shelby_result.get("success"):
+            shelby_cid = shelby_result["blob_name"]
+            logger.info(f"Shelby upload successful: {shelby_cid}")
+        else:
+            logger.warning(f"Shelby upload skipped: {shelby_result.get('error', 'Unknown error') if shelby_result else 'Timeout'}")
+    
+    if client is None:
+        return None, shelby_result, deferred
+    
+    verdict_data = aep.get("verdict") or {}
+    async with client:
+        aptos_tx_hash = await client.submit_verdict(
+            chain_metadata,
+            shelby_cid,
+            verdict_data.get("decision", "UNCERTAIN"),
+            int(verdict_data.get("truth_probability", 50)),
+        )
+    
+    if aptos_tx_hash:
+        logger.info(f"Aptos submission successful: {aptos_tx_hash}")
+    else:
+        logger.warning("Aptos submission failed - no transaction hash returned")
+    return aptos_tx_hash, shelby_result, deferred
+
+
 # ============ Main Pipeline ============
-def run_truthchain(claim: str):
-    """Run the full TruthChain pipeline with PARALLEL agent execution."""
+async def analyze_claim(
+    claim: str,
+    fact_checker: FactChecker,
+    forensic_expert: ForensicExpert,
+    progress: SwarmProgress | None = None,
+    llm_sem: asyncio.Semaphore | None = None,
+    search_sem: asyncio.Semaphore | None = None,
+) -> tuple[dict, dict]:
+    """
+    Run Agent 1 and Agent 2 concurrently (they share no data).
+    
+    The optional semaphores cap concurrent LLM / search calls across a batch.
+    """
+    async def run_fact_checker() -> dict:
+        async with search_sem or nullcontext():
+            result = await fact_checker.averify_claim(claim)
+        if progress:
+            progress.complete(progress.fc_task, "Fact Checker: Evidence gathered")
+        return result
+    
+    async def run_forensic_expert() -> dict:
+        async with llm_sem or nullcontext():
+            result = await forensic_expert.aanalyze_text(claim)
+        if progress:
+            progress.complete(progress.fe_task, "Forensic Expert: Analysis complete")
+        return result
+    
+    a1_result, a2_result = await asyncio.gather(run_fact_checker(), run_forensic_expert())
+    return a1_result, a2_result
+
+
+async def lookup_and_analyze(
+    claim: str,
+    claim_hash: str,
+    fact_checker: FactChecker,
+    forensic_expert: ForensicExpert,
+    progress: SwarmProgress | None = None,
+) -> tuple[CachedVerdict | None, tuple[dict, dict] | None]:
+    """
+    Run the on-chain verdict lookup alongside Agent 1 and Agent 2.
+    
+    The lookup gets a short head start: a fresh verdict found within
+    _CHAIN_LOOKUP_DEADLINE skips the agents entirely. Otherwise the agents run
+    while the lookup finishes and their results are kept; the caller checks the
+    lookup result so a fresh verdict already on-chain is not re-submitted.
+    
+    Returns:
+        (cached_verdict, agent_results); agent_results is None only when a fresh
+        verdict was found before the agents started.
+    """
+    loop = asyncio.get_running_loop()
+    chain_future = loop.run_in_executor(_PIPELINE_POOL, cached_lookup, claim, claim_hash)
+    
+    async def lookup_result() -> CachedVerdict | None:
+        try:
+            return await chain_future
+        except Exception as e:
+            logger.warning(f"Chain lookup failed: {e}")
+            return None
+    
+    await asyncio.wait((chain_future,), timeout=_CHAIN_LOOKUP_DEADLINE)
+    if chain_future.done():
+        cached_verdict = await lookup_result()
+        if cached_verdict and cached_verdict.is_fresh:
+            return cached_verdict, None
+    
+    agent_results = await analyze_claim(claim, fact_checker, forensic_expert, progress)
+    return await lookup_result(), agent_results
+
+
+async def batch_verify(claims: list[str]) -> list[dict]:
+    """
+    Verify many claims concurrently, bounded by the agent semaphores.
+    
+    Args:
+        claims: Claim statements to verify
+    
+    Returns:
+        AEP packages from The Judge, in the same order as claims.
+    """
+    fact_checker = FactChecker()
+    forensic_expert = ForensicExpert()
+    judge = TheJudge()
+    llm_sem = asyncio.Semaphore(_LLM_CONCURRENCY)
+    search_sem = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+    
+    async def verify_one(claim: str) -> dict:
+        a1_result, a2_result = await analyze_claim(
+            claim, fact_checker, forensic_expert, llm_sem=llm_sem, search_sem=search_sem
+        )
+        async with llm_sem:
+            return await judge.aadjudicate(a1_result, a2_result)
+    
+    return await asyncio.gather(*(verify_one(c) for c in claims))
+
+
+def run_truthchain(claim: str, claim_hash: str | None = None, defer_upload: bool = False):
+    """
+    Run the full TruthChain pipeline with PARALLEL agent execution.
+    
+    Args:
+        claim: The claim statement to verify
+        claim_hash: Normalized claim hash, if the caller already computed it
+        defer_upload: Queue the Shelby upload for flush_shelby_uploads instead of uploading now
+            (honoured only for a registry-admin signer, which can attach the CID afterwards)
+    """
     logger.info(f"Processing claim: {claim}")
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
+    if claim_hash is None:
+        claim_hash = generate_claim_hash(claim)
     
     print_header()
     print_claim_box(claim)
     
-    # ============ STEP 0: Check Blockchain for Existing Verdict ============
+    # ============ STEP 0 + PARALLEL: Chain Lookup alongside Agent 1 + Agent 2 ============
     console.print()
-    console.print(Panel(
-        "[bold blue]⛓️ Checking Blockchain for Cached Verdict[/bold blue]\n"
-        "[dim]Searching for existing fact-checks on-chain...[/dim]",
-        border_style="blue",
+    console.print(_panel(
+        "[bold cyan]⚡ Running Chain Lookup, Agent 1 & Agent 2 in PARALLEL[/bold cyan]\n"
+        "[dim]• Blockchain: Searching for existing fact-checks on-chain...\n"
+        "• Fact Checker: Searching web for evidence...\n"
+        "• Forensic Expert: Analyzing linguistic patterns...[/dim]",
+        border_style="cyan",
         padding=(0, 2)
     ))
     
-    cached_verdict = None
-    try:
-        with console.status("[bold blue]⛓️ Searching blockchain...", spinner="dots"):
-            cached_verdict = lookup_cached_verdict(claim)
-    except Exception as e:
-        logger.warning(f"Chain lookup failed: {e}")
-        console.print(f"[dim]Chain lookup skipped: {e}[/dim]")
+    logger.info("Starting chain lookup, Agent 1 & Agent 2 in parallel")
     
-    if cached_verdict:
-        # Found a cached verdict!
-        if cached_verdict.is_fresh:
-            console.print(Panel(
+    # Initialize agents
+    fact_checker = FactChecker()
+    forensic_expert = ForensicExpert()
+    
+    a1_result = None
+    a2_result = None
+    
+    # One live display tracks the lookup and all three agents; results print above it as they land
+    with SwarmProgress() as swarm:
+        # The chain lookup gets a head start; a fresh verdict means the agents never run
+        parallel_start_ns = time.monotonic_ns()
+        cached_verdict, agent_results = asyncio.run(
+            lookup_and_analyze(claim, claim_hash, fact_checker, forensic_expert, swarm)
+        )
+        
+        if agent_results is None:
+            swarm.complete(swarm.chain_task, "Blockchain: Cached verdict found")
+            console.print(_panel(
                 f"[bold green]✅ CACHED VERDICT FOUND (Fresh)[/bold green]\n\n"
                 f"[white]Verdict:[/white] [bold]{cached_verdict.verdict}[/bold]\n"
                 f"[white]Confidence:[/white] {cached_verdict.confidence}%\n"
@@ -900,7 +890,7 @@ def run_truthchain(claim: str):
                 padding=(1, 2)
             ))
             
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.monotonic_ns() - start_ns) / 1e9
             console.print(f"\n[dim]⚡ Lookup completed in {elapsed_time:.1f}s[/dim]")
             logger.info(f"Cache hit! Verdict: {cached_verdict.verdict}, Confidence: {cached_verdict.confidence}")
             
@@ -916,8 +906,25 @@ def run_truthchain(claim: str):
                 "shelby_cid": cached_verdict.shelby_cid,
                 "from_chain": True,
             }
-        else:
-            console.print(Panel(
+        
+        swarm.complete(swarm.chain_task, "Blockchain: Lookup complete")
+        # A fresh verdict that arrived after the agents started: keep their analysis, don't re-submit
+        already_on_chain = bool(cached_verdict and cached_verdict.is_fresh)
+        if already_on_chain:
+            console.print(_panel(
+                f"[bold green]✅ FRESH VERDICT ALREADY ON-CHAIN[/bold green]\n\n"
+                f"[white]Verdict:[/white] [bold]{cached_verdict.verdict}[/bold]\n"
+                f"[white]Confidence:[/white] {cached_verdict.confidence}%\n"
+                f"[white]Claim Hash:[/white] [cyan]{cached_verdict.claim_hash}[/cyan]\n\n"
+                f"[dim]Found after the agents had started - showing their analysis, "
+                f"but it will not be re-submitted[/dim]",
+                title="[green]⛓️ Already Recorded[/green]",
+                border_style="green",
+                padding=(1, 2)
+            ))
+            logger.info(f"Fresh verdict found after agents started, not re-submitting: {cached_verdict.claim_hash}")
+        elif cached_verdict:
+            console.print(_panel(
                 f"[bold yellow]⚠️ STALE VERDICT FOUND[/bold yellow]\n\n"
                 f"[white]Previous Verdict:[/white] {cached_verdict.verdict}\n"
                 f"[white]Claim Hash:[/white] [dim]{cached_verdict.claim_hash}[/dim]\n\n"
@@ -927,133 +934,91 @@ def run_truthchain(claim: str):
                 padding=(1, 2)
             ))
             logger.info(f"Stale verdict found, re-verifying: {cached_verdict.claim_hash}")
-    else:
-        console.print("[dim]No cached verdict found - running full verification...[/dim]")
-    
-    # ============ PARALLEL: Agent 1 + Agent 2 ============
-    console.print()
-    console.print(Panel(
-        "[bold cyan]⚡ Running Agent 1 & Agent 2 in PARALLEL[/bold cyan]\n"
-        "[dim]• Fact Checker: Searching web for evidence...\n"
-        "• Forensic Expert: Analyzing linguistic patterns...[/dim]",
-        border_style="cyan",
-        padding=(0, 2)
-    ))
-    
-    logger.info("Starting Agent 1 & Agent 2 in parallel")
-    
-    # Initialize agents
-    fact_checker = FactChecker()
-    forensic_expert = ForensicExpert()
-    
-    a1_result = None
-    a2_result = None
-    
-    # Run both agents in parallel using ThreadPoolExecutor
-    with console.status("[bold cyan]⚡ Parallel Analysis: Fact Checker + Forensic Expert...", spinner="dots"):
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both tasks
-            future_a1 = executor.submit(fact_checker.verify_claim, claim)
-            future_a2 = executor.submit(forensic_expert.analyze_text, claim)
-            
-            # Wait for both to complete
-            a1_result = future_a1.result()
-            a2_result = future_a2.result()
-    
-    parallel_time = time.time() - start_time
-    logger.info(f"Parallel execution complete in {parallel_time:.1f}s")
-    
-    # Display Agent 1 results
-    print_agent_header(1, "Agent 1: The Fact Checker", "🔍", "blue")
-    logger.info(f"Agent 1 complete: {a1_result.get('preliminary_verdict', 'N/A')}")
-    print_fact_checker_results(a1_result)
-    
-    # Display Agent 2 results
-    print_agent_header(2, "Agent 2: The Forensic Expert", "🕵️", "magenta")
-    logger.info(f"Agent 2 complete: Score {a2_result.get('integrity_score', 0):.2f}")
-    print_forensic_results(a2_result)
-    
-    # ============ Agent 3: The Judge ============
-    print_agent_header(3, "Agent 3: The Judge", "⚖️", "yellow")
-    console.print("[dim]Synthesizing evidence and rendering verdict...[/dim]")
-    
-    logger.info("Starting Agent 3: The Judge")
-    judge = TheJudge()
+        else:
+            console.print("[dim]No cached verdict found - running full verification...[/dim]")
+        
+        a1_result, a2_result = agent_results
+        
+        parallel_time = (time.monotonic_ns() - parallel_start_ns) / 1e9
+        logger.info(f"Parallel execution complete in {parallel_time:.1f}s")
+        
+        # Display Agent 1 results
+        print_agent_header(1, "Agent 1: The Fact Checker", "🔍", "blue")
+        logger.info(f"Agent 1 complete: {a1_result.get('preliminary_verdict', 'N/A')}")
+        print_fact_checker_results(a1_result)
+        
+        # Display Agent 2 results
+        print_agent_header(2, "Agent 2: The Forensic Expert", "🕵️", "magenta")
+        logger.info(f"Agent 2 complete: Score {a2_result.get('integrity_score', 0):.2f}")
+        print_forensic_results(a2_result)
+        
+        # ============ Agent 3: The Judge ============
+        print_agent_header(3, "Agent 3: The Judge", "⚖️", "yellow")
+        console.print("[dim]Synthesizing evidence and rendering verdict...[/dim]")
+        
+        logger.info("Starting Agent 3: The Judge")
+        judge = TheJudge()
+        
+        swarm.update(swarm.judge_task, "⚖️ The Judge: Deliberating...")
+        aep = asyncio.run(judge.aadjudicate(a1_result, a2_result))
+        swarm.complete(swarm.judge_task, "The Judge: Verdict rendered")
     
-    with console.status("[bold yellow]⚖️ The Judge: Deliberating...", spinner="dots"):
-        aep = judge.adjudicate(a1_result, a2_result)
+    # Destructure the verdict once for logging and the summary
+    verdict_data = aep.get("verdict") or {}
+    decision = verdict_data.get("decision", "N/A")
+    truth_prob = verdict_data.get("truth_probability", 50)
     
-    logger.info(f"Agent 3 complete: {aep.get('verdict', {}).get('decision', 'N/A')}")
+    logger.info(f"Agent 3 complete: {decision}")
     print_judge_results(aep)
     
-    # ============ PARALLEL: PDF Generation + Shelby Upload Prep ============
+    # ============ PARALLEL: PDF Generation + Aptos Submission ============
     console.print()
     
     pdf_path = None
     shelby_result = None
-    
-    with console.status("[bold cyan]📄 Generating PDF Report...", spinner="dots"):
-        pdf_path = generate_pdf_report(claim, a1_result, a2_result, aep)
-    
-    logger.info(f"PDF report generated: {pdf_path}")
-    
-    # Upload to Shelby in background (non-blocking)
-    if shutil.which("shelby"):
-        def upload_async():
-            return upload_to_shelby(pdf_path, expiry="in 30 days")
+    aptos_tx_hash = None
+    shelby_available = SHELBY_BIN is not None
+    upload_now = shelby_available and not already_on_chain
+    
+    # One spinner for every post-verdict stage, relabelled as each begins
+    with PipelineProgress("[bold cyan]📄 Generating PDF Report...") as pipeline:
+        futures = {generate_pdf_report_async(claim, a1_result, a2_result, aep): "pdf"}
+        if not upload_now and not already_on_chain:
+            # No Shelby CID to wait for, so submit the verdict while the PDF renders
+            pipeline.stage("[bold cyan]📄 Generating PDF Report + ⛓️ Submitting to Aptos...")
+            futures[_PIPELINE_POOL.submit(submit_aep_to_chain, aep, "")] = "chain"
         
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            shelby_future = executor.submit(upload_async)
-            
-            # Show quick status while uploading
-            with console.status("[bold magenta]☁️ Uploading to Shelby...", spinner="dots"):
-                shelby_result = shelby_future.result(timeout=30)
+        for future in as_completed(futures):
+            if futures[future] == "pdf":
+                pdf_path = future.result()
+                logger.info(f"PDF report generated: {pdf_path}")
+                console.print("[dim]📄 PDF report generated[/dim]")
+            else:
+                aptos_tx_hash = future.result()
+                console.print("[dim]⛓️ Aptos submission finished[/dim]")
         
-        if shelby_result and shelby_result.get("success"):
-            logger.info(f"Shelby upload successful: {shelby_result.get('blob_name')}")
-        else:
-            logger.warning(f"Shelby upload skipped: {shelby_result.get('error', 'Unknown error') if shelby_result else 'Timeout'}")
-    
-    # ============ Submit to Aptos Blockchain ============
-    aptos_tx_hash = None
-    chain_metadata = aep.get("chain_metadata", {})
-    verdict_decision = aep.get("verdict", {}).get("decision", "UNCERTAIN")
-    confidence_score = int(aep.get("verdict", {}).get("truth_probability", 50))
-    shelby_cid = shelby_result.get("blob_name", "") if shelby_result and shelby_result.get("success") else ""
+        # Upload to Shelby first so the verdict is submitted with its CID
+        if upload_now:
+            # ============ Submit to Aptos Blockchain ============
+            pipeline.stage("[bold blue]☁️ Uploading to Shelby + ⛓️ Submitting to Aptos...")
+            aptos_tx_hash, shelby_result, deferred = asyncio.run(
+                publish_verdict(aep, pdf_path, defer_upload=defer_upload)
+            )
+            if deferred:
+                # Uploaded with the rest of the session's reports; the CID is attached on flush
+                _PENDING_UPLOADS.append((pdf_path, aep))
+                console.print("[dim]☁️ Report queued for batched Shelby upload[/dim]")
+        elif already_on_chain:
+            console.print("[dim]⛓️ Verdict already on-chain - skipping submission and upload[/dim]")
     
-    if chain_metadata.get("claim_hash"):
-        with console.status("[bold blue]⛓️ Submitting to Aptos Blockchain...", spinner="dots"):
-            try:
-                aptos_tx_hash = submit_verdict_to_chain(
-                    chain_metadata=chain_metadata,
-                    shelby_cid=shelby_cid,
-                    verdict=verdict_decision,
-                    confidence=confidence_score,
-                )
-                if aptos_tx_hash:
-                    logger.info(f"Aptos submission successful: {aptos_tx_hash}")
-                    # Update AEP with transaction hash
-                    aep["storage"]["aptos_tx"] = aptos_tx_hash
-                else:
-                    logger.warning("Aptos submission failed - no transaction hash returned")
-            except Exception as e:
-                logger.error(f"Aptos submission error: {e}")
+    if aptos_tx_hash:
+        # Update AEP with transaction hash
+        aep["storage"]["aptos_tx"] = aptos_tx_hash
     
     # ============ Summary ============
-    elapsed_time = time.time() - start_time
-    
-    verdict_data = aep.get("verdict", {})
-    truth_prob = verdict_data.get("truth_probability", 50)
+    elapsed_time = (time.monotonic_ns() - start_ns) / 1e9
     
-    if truth_prob >= 60:
-        color, icon = "green", "✅"
-        verdict_display = f"{truth_prob:.0f}% likely TRUE"
-    elif truth_prob <= 40:
-        color, icon = "red", "❌"
-        verdict_display = f"{100-truth_prob:.0f}% likely FALSE"
-    else:
-        color, icon = "yellow", "⚠️"
-        verdict_display = f"Uncertain ({truth_prob:.0f}%)"
+    color, icon, verdict_display = _verdict_style(truth_prob)
     
     # Build summary text with performance metrics
     summary_text = (
@@ -1076,7 +1041,7 @@ def run_truthchain(claim: str):
     summary_text += f"[dim]Log File: {log_file}[/dim]"
     
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         summary_text,
         title="[bold green]⚡ Summary (Optimized)[/bold green]",
         border_style="green",
@@ -1085,7 +1050,12 @@ def run_truthchain(claim: str):
     
     # Open PDF automatically on macOS
     if sys.platform == "darwin":
-        os.system(f'open "{pdf_path}"')
+        subprocess.Popen(
+            ["open", pdf_path],
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     
     logger.info(f"Pipeline complete in {elapsed_time:.1f}s")
     logger.info(f"Final verdict: {verdict_display}")
@@ -1093,11 +1063,20 @@ def run_truthchain(claim: str):
     return aep
 
 
+# Sample claims for the interactive 'demo' command
+DEMO_CLAIMS = (
+    "Tesla announced they are acquiring Twitter for $100 billion",
+    "URGENT!!! Amazon is bank curpted! CLICK HERE NOW to save your account!",
+    "Apple Inc. reported Q4 2025 earnings of $1.95 per share, exceeding analyst expectations.",
+    "Breaking: Bitcoin will reach $1 million by tomorrow according to insider sources!",
+)
+
+
 def interactive_mode():
     """Run in interactive mode with multiple claims."""
     print_header()
     
-    console.print(Panel(
+    console.print(_panel(
         "[bold white]Interactive Mode[/bold white]\n\n"
         "Enter claims to verify. Type [cyan]'quit'[/cyan] or [cyan]'exit'[/cyan] to stop.\n"
         "Type [cyan]'demo'[/cyan] for a sample claim.",
@@ -1105,48 +1084,71 @@ def interactive_mode():
         padding=(1, 2)
     ))
     
-    demo_claims = [
-        "Tesla announced they are acquiring Twitter for $100 billion",
-        "URGENT!!! Amazon is bank curpted! CLICK HERE NOW to save your account!",
-        "Apple Inc. reported Q4 2025 earnings of $1.95 per share, exceeding analyst expectations.",
-        "Breaking: Bitcoin will reach $1 million by tomorrow according to insider sources!"
-    ]
+    # Admin signers batch Shelby uploads across the session and flush them on the way out
+    try:
+        while True:
+            console.print()
+            claim = console.input("[bold cyan]📝 Enter claim to verify:[/bold cyan] ").strip()
+            
+            if claim.lower() in ['quit', 'exit', 'q']:
+                break
+            
+            if claim.lower() == 'demo':
+                claim = random.choice(DEMO_CLAIMS)
+                console.print(f"[dim]Using demo claim: {claim}[/dim]")
+            
+            if not claim:
+                console.print("[yellow]Please enter a claim to verify.[/yellow]")
+                continue
+            
+            # Validate input is a claim, not a question (case and spacing don't affect the result)
+            normalized = " ".join(claim.lower().split())
+            is_valid, error_msg = _validate_claim_cached(normalized)
+            if not is_valid:
+                console.print(error_msg)
+                continue
+            
+            # Hash once per input; repeat claims hit the in-process verdict cache by this key
+            claim_hash = generate_claim_hash(claim)
+            
+            try:
+                run_truthchain(claim, claim_hash, defer_upload=True)
+            except Exception as e:
+                logger.error(f"Error processing claim: {e}", exc_info=True)
+                console.print(f"[red]Error: {e}[/red]")
+                console.print("[dim]Check log file for details.[/dim]")
+            
+            if len(_PENDING_UPLOADS) >= _UPLOAD_BATCH_SIZE:
+                flush_shelby_uploads()
+    finally:
+        flush_shelby_uploads()
     
-    while True:
-        console.print()
-        claim = console.input("[bold cyan]📝 Enter claim to verify:[/bold cyan] ").strip()
-        
-        if claim.lower() in ['quit', 'exit', 'q']:
-            console.print("\n[bold green]👋 Goodbye![/bold green]\n")
-            break
-        
-        if claim.lower() == 'demo':
-            import random
-            claim = random.choice(demo_claims)
-            console.print(f"[dim]Using demo claim: {claim}[/dim]")
-        
-        if not claim:
-            console.print("[yellow]Please enter a claim to verify.[/yellow]")
-            continue
-        
-        # Validate input is a claim, not a question
-        is_valid, error_msg = validate_claim(claim)
-        if not is_valid:
-            console.print(error_msg)
-            continue
-        
-        try:
-            run_truthchain(claim)
-        except Exception as e:
-            logger.error(f"Error processing claim: {e}", exc_info=True)
-            console.print(f"[red]Error: {e}[/red]")
-            console.print("[dim]Check log file for details.[/dim]")
+    console.print("\n[bold green]👋 Goodbye![/bold green]\n")
 
 
 # ============ Entry Point ============
 if __name__ == "__main__":
     try:
-        if len(sys.argv) > 1:
+        if len(sys.argv) == 3 and sys.argv[1] == "--batch":
+            # Batch mode: one claim per line in the given file
+            with open(sys.argv[2], encoding="utf-8") as f:
+                claims = [line.strip() for line in f if line.strip()]
+            
+            valid_claims = []
+            for claim in claims:
+                is_valid, error_msg = validate_claim(claim)
+                if is_valid:
+                    valid_claims.append(claim)
+                else:
+                    console.print(f"[dim]Skipping: {claim}[/dim]")
+            
+            with console.status(f"[bold cyan]⚡ Verifying {len(valid_claims)} claims...", spinner="dots"):
+                aeps = asyncio.run(batch_verify(valid_claims))
+            
+            for claim, aep in zip(valid_claims, aeps):
+                print_claim_box(claim)
+                print_judge_results(aep)
+        elif len(sys.argv) > 1:
             # Command line argument mode
             claim = " ".join(sys.argv[1:])
             
@@ -61,9 +61,26 @@ if (SCRIPT_DIR / "api.py").exists():
 else:
     print("⚠️  Warning: 'api.py' file not found")
 
+# Storage utilities only touch the volume. On `image` they would run the startup import
+# below and load the whole agent stack just to list or delete files, so they get a bare image
+storage_image = modal.Image.debian_slim(python_version="3.12")
+
 # Volume mount path (must match storage directory in the app)
 VOLUME_PATH = "/app/storage"
 
+# Import the API (and its LangChain/LangGraph agents) once at container startup
+# instead of inside fastapi_app. The block runs in every context: the is_local()
+# guard skips it locally, and in storage_image containers `import api` fails fast
+# (no app code there) and image.imports() swallows the ImportError.
+with image.imports():
+    if not modal.is_local():
+        import sys
+        sys.path.insert(0, "/app")
+        
+        import api
+        from agents.shelby import Shelby
+        from fastapi.staticfiles import StaticFiles
+
 
 @app.function(
     image=image,
@@ -82,36 +99,25 @@ def fastapi_app():
     The ASGI app is returned directly for Modal to serve.
     Volume is mounted at /app/storage for persistent PDF storage.
     """
-    import sys
     import os
     
-    # Add app directory to path for imports
-    sys.path.insert(0, "/app")
-    
     # Set storage directory to use the mounted volume
     os.environ["STORAGE_DIR"] = VOLUME_PATH
     
     # Ensure storage directory exists
     os.makedirs(VOLUME_PATH, exist_ok=True)
     
-    # Import and return the FastAPI app
-    from api import app as fastapi_application
-    
-    # Update the Shelby storage directory to use the volume
-    from agents.shelby import Shelby
+    fastapi_application = api.app
     
     # Patch the storage directory in the API module
-    import api
     api.STORAGE_DIR = VOLUME_PATH
     api.shelby = Shelby(storage_dir=VOLUME_PATH)
     
-    # Re-mount the static files directory with the new path
-    from fastapi.staticfiles import StaticFiles
-    
-    # Remove existing mount if present and remount with volume path
-    for route in list(fastapi_application.routes):
-        if hasattr(route, 'path') and route.path == "/download":
-            fastapi_application.routes.remove(route)
+    # Remove existing mount if present (single pass) and remount with volume path
+    fastapi_application.routes[:] = [
+        r for r in fastapi_application.routes
+        if not (hasattr(r, 'path') and r.path == "/download")
+    ]
     
     fastapi_application.mount("/download", StaticFiles(directory=VOLUME_PATH), name="download")
     
@@ -119,7 +125,7 @@ def fastapi_app():
 
 
 @app.function(
-    image=image,
+    image=storage_image,
     volumes={VOLUME_PATH: volume},
 )
 def cleanup_old_reports(days: int = 7):
@@ -135,11 +141,11 @@ def cleanup_old_reports(days: int = 7):
     cutoff = time.time() - (days * 24 * 60 * 60)
     deleted = 0
     
-    for filename in os.listdir(VOLUME_PATH):
-        filepath = os.path.join(VOLUME_PATH, filename)
-        if os.path.isfile(filepath):
-            if os.path.getmtime(filepath) < cutoff:
-                os.remove(filepath)
+    # DirEntry caches its type and stat, so each file costs one stat() at most
+    with os.scandir(VOLUME_PATH) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
                 deleted += 1
     
     # Commit changes to volume
@@ -149,7 +155,7 @@ def cleanup_old_reports(days: int = 7):
 
 
 @app.function(
-    image=image,
+    image=storage_image,
     volumes={VOLUME_PATH: volume},
 )
 def list_reports():
@@ -162,15 +168,15 @@ def list_reports():
     import os
     
     files = []
-    for filename in os.listdir(VOLUME_PATH):
-        filepath = os.path.join(VOLUME_PATH, filename)
-        if os.path.isfile(filepath):
-            stat = os.stat(filepath)
-            files.append({
-                "name": filename,
-                "size": stat.st_size,
-                "modified": stat.st_mtime
-            })
+    with os.scandir(VOLUME_PATH) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                files.append({
+                    "name": entry.name,
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime
+                })
     
     return files
 
@@ -0,0 +1,480 @@
+"""
+MoveH PDF Report
+
+Renders the CLI fact-check report with ReportLab.
+Kept separate from main.py so ReportLab is only imported when a report is generated.
+"""
+
+import os
+import re
+import logging
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, Table as RLTable, 
+    TableStyle, HRFlowable, KeepTogether, Flowable
+)
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+
+logger = logging.getLogger("SentinelSwarm")
+
+# Upper bound on Judge reasoning rendered into a report
+_MAX_REASONING_CHARS = 8192
+
+
+# Host part of a source URL, without a leading "www."
+_DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+
+# Host suffixes for source badges
+_OFFICIAL_HOSTS = (".gov", ".gov.uk", ".gov.in")
+_NEWS_HOSTS = ("reuters.com", "apnews.com", "bbc.co.uk", "nytimes.com")
+
+# Colors
+DARK = colors.HexColor('#0f172a')
+GRAY_700 = colors.HexColor('#334155')
+GRAY_600 = colors.HexColor('#475569')
+GRAY_500 = colors.HexColor('#64748b')
+GRAY_200 = colors.HexColor('#e2e8f0')
+GRAY_50 = colors.HexColor('#f8fafc')
+BLUE = colors.HexColor('#3b82f6')
+_GREEN_HEX, _AMBER_HEX, _RED_HEX = "#10b981", "#f59e0b", "#ef4444"
+GREEN = colors.HexColor(_GREEN_HEX)
+RED = colors.HexColor(_RED_HEX)
+AMBER = colors.HexColor(_AMBER_HEX)
+WHITE = colors.white
+
+# Paragraph styles, built once and shared by every report
+_STYLE_STAMP = ParagraphStyle(
+    'Stamp', fontSize=28, textColor=WHITE, fontName='Helvetica-Bold', 
+    alignment=TA_CENTER, leading=32, spaceBefore=2
+)
+_STYLE_SUB = ParagraphStyle('Sub', fontSize=10, textColor=WHITE, alignment=TA_CENTER)
+_STYLE_LOGO = ParagraphStyle('Logo', fontSize=10, textColor=GRAY_600, fontName='Helvetica-Bold')
+_STYLE_DATE = ParagraphStyle('Date', fontSize=10, textColor=GRAY_500, alignment=TA_RIGHT)
+_STYLE_RUMOR = ParagraphStyle('Rumor', fontSize=11, leading=15, textColor=GRAY_700)
+_STYLE_REALITY = ParagraphStyle('Reality', fontSize=10, leading=14, textColor=GRAY_600)
+_STYLE_CLAIM_HEAD = ParagraphStyle('H1', fontSize=8, textColor=GRAY_500)
+_STYLE_REALITY_HEAD = ParagraphStyle('H2', fontSize=8, textColor=BLUE)
+_STYLE_METRIC = ParagraphStyle('Metric', fontSize=8, alignment=TA_CENTER, leading=16)
+_STYLE_CHAIN_HEAD = ParagraphStyle('ChainHead', fontSize=10, fontName='Helvetica-Bold', spaceAfter=8, textColor=GRAY_700)
+_STYLE_SECTION_HEAD = ParagraphStyle('Head', fontSize=12, fontName='Helvetica-Bold', spaceAfter=10)
+_STYLE_SOURCE_TITLE = ParagraphStyle('ST', fontSize=9)
+_STYLE_SOURCE_SNIP = ParagraphStyle('Snip', fontSize=8, leading=10)
+_STYLE_SOURCE_DOM = ParagraphStyle('Dom', fontSize=7, textColor=BLUE)
+_STYLE_BADGE_DEFAULT = ParagraphStyle(
+    'Badg', fontSize=6, backColor=GRAY_200, textColor=GRAY_700, alignment=TA_CENTER, borderPadding=2
+)
+_STYLE_BADGE_OFFICIAL = ParagraphStyle(
+    'BadgOfficial', parent=_STYLE_BADGE_DEFAULT, backColor=colors.HexColor('#dcfce7'), textColor=GREEN
+)
+_STYLE_BADGE_NEWS = ParagraphStyle(
+    'BadgNews', parent=_STYLE_BADGE_DEFAULT, backColor=colors.HexColor('#dbeafe'), textColor=BLUE
+)
+_STYLE_RISK = ParagraphStyle('Risk', fontSize=9, fontName='Helvetica-Bold')
+_STYLE_FLAGS = ParagraphStyle('Flags', fontSize=9, textColor=GRAY_700, leading=14)
+_STYLE_FOOT = ParagraphStyle('Foot', fontSize=7, textColor=GRAY_500, alignment=TA_CENTER)
+
+
+def _source_badge(domain: str) -> tuple[str, ParagraphStyle]:
+    """Badge text and style for a source, matched on its host rather than the full URL."""
+    if domain.endswith(_OFFICIAL_HOSTS):
+        return "OFFICIAL", _STYLE_BADGE_OFFICIAL
+    if domain.endswith(_NEWS_HOSTS):
+        return "NEWS", _STYLE_BADGE_NEWS
+    return "SOURCE", _STYLE_BADGE_DEFAULT
+
+
+def _iter_sources(a1_result: dict):
+    """Yield each search result dict across all of Agent 1's searches."""
+    for sr in a1_result.get("search_results", ()):
+        if not isinstance(sr, dict):
+            continue
+        for result in sr.get("results", ()):
+            if isinstance(result, dict):
+                yield result
+
+class ConfidenceGauge(Flowable):
+    """Custom flowable for semi-circle confidence gauge."""
+    def __init__(self, percentage, color, width=120, height=60):
+        Flowable.__init__(self)
+        self.percentage = percentage
+        self.color = color
+        self.width = width
+        self.height = height
+
+    def wrap(self, availWidth, availHeight):
+        # This tells the Table exactly how much space to reserve
+        return self.width, self.height
+
+    def draw(self):
+        from reportlab.lib.colors import HexColor
+        
+        # Center the drawing in the available space
+        cx = self.width / 2
+        cy = 5  # Bottom padding
+        radius = min(self.width / 2, self.height) - 5
+        
+        # Background arc (darker gray for contrast with white progress)
+        self.canv.setLineWidth(12)
+        self.canv.setStrokeColor(HexColor('#6b7280'))
+        self.canv.setFillColor(colors.transparent)
+        # arc(x1, y1, x2, y2, startAng, extent)
+        self.canv.arc(cx - radius, cy - radius, cx + radius, cy + radius, 0, 180)
+        
+        # Foreground arc (white progress on dark background)
+        angle = 180 * (self.percentage / 100)
+        self.canv.setStrokeColor(self.color)
+        self.canv.arc(cx - radius, cy - radius, cx + radius, cy + radius, 180 - angle, angle)
+        
+        # Percentage Text
+        self.canv.setFillColor(HexColor('#ffffff')) # White text looks better on colored headers
+        self.canv.setFont('Helvetica-Bold', 14)
+        self.canv.drawCentredString(cx, cy + 5, f"{self.percentage:.0f}%")
+
+class DonutChart(Flowable):
+    """Custom flowable for donut chart."""
+    def __init__(self, percentage, color, size=50, label=""):
+        Flowable.__init__(self)
+        self.percentage = percentage
+        self.color = color
+        self.size = size
+        self.label = label
+        self.width = size
+        self.height = size + 15 # Reserve space for label
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        from reportlab.lib.colors import HexColor
+        
+        cx = self.width / 2
+        cy = self.height - (self.size / 2) # Top aligned
+        radius = self.size / 2
+        inner_radius = radius * 0.6
+        
+        # Background circle
+        self.canv.setFillColor(HexColor('#e2e8f0'))
+        self.canv.setStrokeColor(colors.transparent)
+        self.canv.circle(cx, cy, radius, fill=1, stroke=0)
+        
+        # Wedge (Foreground)
+        if self.percentage > 0:
+            self.canv.setFillColor(self.color)
+            angle = 360 * (self.percentage / 100)
+            p = self.canv.beginPath()
+            p.moveTo(cx, cy)
+            # arcTo draws a curve. simplified wedge approach:
+            p.arc(cx - radius, cy - radius, cx + radius, cy + radius, 90, angle) 
+            p.lineTo(cx, cy)
+            p.close()
+            self.canv.drawPath(p, fill=1, stroke=0)
+        
+        # Inner white circle (Donut hole)
+        self.canv.setFillColor(colors.white)
+        self.canv.circle(cx, cy, inner_radius, fill=1, stroke=0)
+        
+        # Center Value
+        self.canv.setFillColor(HexColor('#0f172a'))
+        self.canv.setFont('Helvetica-Bold', 9)
+        self.canv.drawCentredString(cx, cy - 3, f"{self.percentage:.0f}%")
+        
+        # Bottom Label
+        if self.label:
+            self.canv.setFont('Helvetica', 8)
+            self.canv.setFillColor(HexColor('#64748b'))
+            self.canv.drawCentredString(cx, 0, self.label)
+
+
+def generate_pdf_report(claim: str, a1_result: dict, a2_result: dict, aep: dict) -> str:
+    """Generate a professional PDF report with visual elements."""
+    
+    reports_dir = os.path.join(os.path.dirname(__file__), "reports")
+    os.makedirs(reports_dir, exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pdf_path = os.path.join(reports_dir, f"moveh_report_{timestamp}.pdf")
+    
+    # ReportLab streams pages straight into this buffered handle
+    pdf_file = open(pdf_path, "wb", buffering=64 * 1024)
+    
+    try:
+        # Create document
+        doc = SimpleDocTemplate(
+            pdf_file,
+            pagesize=A4,
+            rightMargin=40,
+            leftMargin=40,
+            topMargin=40,
+            bottomMargin=40
+        )
+        
+        # Get verdict data
+        verdict_data = aep.get("verdict", {})
+        truth_prob = verdict_data.get("truth_probability", 50)
+        
+        if truth_prob >= 60:
+            verdict_bg = colors.HexColor('#059669')
+            stamp_text = "TRUE"
+            gauge_pct = truth_prob
+        elif truth_prob <= 40:
+            verdict_bg = colors.HexColor('#dc2626')
+            stamp_text = "FALSE"
+            gauge_pct = 100 - truth_prob
+        else:
+            verdict_bg = colors.HexColor('#d97706')
+            stamp_text = "UNCERTAIN"
+            gauge_pct = 50
+        
+        content = []
+        
+        # ═══════════════════════════════════════════════════════════════
+        # 1. VERDICT HERO SECTION
+        # ═══════════════════════════════════════════════════════════════
+        
+        gauge = ConfidenceGauge(gauge_pct, WHITE, width=80, height=45)
+        
+        hero_content = [
+            [gauge],
+            [Paragraph(f"{stamp_text}", _STYLE_STAMP)],
+            [Paragraph(f"{gauge_pct:.0f}% confidence", _STYLE_SUB)]
+        ]
+        
+        hero_table = RLTable(hero_content, colWidths=[doc.width])
+        hero_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), verdict_bg),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, -1), (-1, -1), 12),
+        ]))
+        content.append(hero_table)
+        content.append(Spacer(1, 15))
+        
+        # Header Info
+        header_row = [[
+            Paragraph("MOVEH", _STYLE_LOGO),
+            Paragraph(f"{datetime.now().strftime('%B %d, %Y')}", _STYLE_DATE)
+        ]]
+        content.append(RLTable(header_row, colWidths=[doc.width/2, doc.width/2]))
+        content.append(HRFlowable(width="100%", thickness=1, color=GRAY_200, spaceAfter=15))
+        
+        # ═══════════════════════════════════════════════════════════════
+        # 2. CLAIM vs REALITY
+        # ═══════════════════════════════════════════════════════════════
+        
+        reasoning = str(aep.get("reasoning", "Analysis in progress..."))[:_MAX_REASONING_CHARS]
+        claim_short = claim[:200] + "..." if len(claim) > 200 else claim
+        
+        rumor_content = [
+            [Paragraph("THE CLAIM", _STYLE_CLAIM_HEAD)],
+            [Paragraph(f'"{claim_short}"', _STYLE_RUMOR)]
+        ]
+        
+        reality_content = [
+            [Paragraph("THE REALITY", _STYLE_REALITY_HEAD)],
+            [Paragraph(reasoning, _STYLE_REALITY)]
+        ]
+        
+        col_w = doc.width * 0.48
+        
+        t_rumor = RLTable(rumor_content, colWidths=[col_w - 12])
+        t_rumor.setStyle(TableStyle([
+            ('BOX', (0, 0), (-1, -1), 1, GRAY_200),
+            ('BACKGROUND', (0, 0), (-1, -1), GRAY_50),
+            ('PADDING', (0, 0), (-1, -1), 6),
+        ]))
+        
+        t_reality = RLTable(reality_content, colWidths=[col_w - 12])
+        t_reality.setStyle(TableStyle([
+            ('BOX', (0, 0), (-1, -1), 1, GRAY_200),
+            ('PADDING', (0, 0), (-1, -1), 6),
+        ]))
+        
+        main_claim_table = RLTable([[t_rumor, t_reality]], colWidths=[col_w, col_w])
+        main_claim_table.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]))
+        content.append(main_claim_table)
+        content.append(Spacer(1, 20))
+
+        # ═══════════════════════════════════════════════════════════════
+        # 3. METRICS - SIMPLIFIED (no custom flowables that may cause issues)
+        # ═══════════════════════════════════════════════════════════════
+        
+        integrity = a2_result.get("integrity_score", 0) * 100
+        ai_prob = a2_result.get("detection_summary", {}).get("ai_probability", 0) * 100
+        sources = list(_iter_sources(a1_result))
+        sources_count = len(sources)
+        red_flags = len(a2_result.get("penalties_applied", []))
+
+        # Simple text-based metrics (more reliable than custom flowables)
+        int_hex = _GREEN_HEX if integrity >= 70 else (_AMBER_HEX if integrity >= 40 else _RED_HEX)
+        ai_hex = _RED_HEX if ai_prob >= 70 else (_AMBER_HEX if ai_prob >= 40 else _GREEN_HEX)
+        
+        metrics_row = [[
+            Paragraph(f"<b>🛡️ Integrity</b><br/><font size='14' color='{int_hex}'>{integrity:.0f}%</font>", _STYLE_METRIC),
+            Paragraph(f"<b>🤖 AI Prob</b><br/><font size='14' color='{ai_hex}'>{ai_prob:.0f}%</font>", _STYLE_METRIC),
+            Paragraph(f"<b>🔗 Sources</b><br/><font size='14'>{sources_count}</font>", _STYLE_METRIC),
+            Paragraph(f"<b>🚩 Red Flags</b><br/><font size='14' color='{_RED_HEX}'>{red_flags}</font>", _STYLE_METRIC),
+        ]]
+        
+        metrics_table = RLTable(metrics_row, colWidths=[doc.width/4]*4)
+        metrics_table.setStyle(TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BACKGROUND', (0, 0), (-1, -1), GRAY_50),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, WHITE),
+        ]))
+        content.append(metrics_table)
+        content.append(Spacer(1, 20))
+
+        # ═══════════════════════════════════════════════════════════════
+        # 3.5 CHAIN METADATA (NEW)
+        # ═══════════════════════════════════════════════════════════════
+        
+        chain_meta = aep.get("chain_metadata", {})
+        keywords = chain_meta.get("keywords", [])
+        claim_type_name = chain_meta.get("claim_type_name", "UNKNOWN")
+        freshness_hours = chain_meta.get("freshness_hours", 0)
+        claim_hash_short = chain_meta.get("claim_hash", "N/A")[:16] + "..."
+        
+        # Format freshness
+        if freshness_hours == 0:
+            freshness_text = "Never expires"
+            freshness_color = GREEN
+        elif freshness_hours <= 24:
+            freshness_text = f"{freshness_hours} hours"
+            freshness_color = RED
+        else:
+            freshness_text = f"{freshness_hours // 24} days"
+            freshness_color = AMBER
+        
+        content.append(Paragraph("ON-CHAIN METADATA", _STYLE_CHAIN_HEAD))
+        
+        chain_data = [
+            ["Keywords", ", ".join(keywords) if keywords else "N/A"],
+            ["Claim Type", claim_type_name],
+            ["Freshness", freshness_text],
+            ["Claim Hash", claim_hash_short],
+        ]
+        
+        chain_table = RLTable(chain_data, colWidths=[doc.width * 0.25, doc.width * 0.75])
+        chain_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), GRAY_50),
+            ('TEXTCOLOR', (0, 0), (0, -1), GRAY_600),
+            ('TEXTCOLOR', (1, 0), (1, -1), GRAY_700),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('PADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, GRAY_200),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        content.append(chain_table)
+        content.append(Spacer(1, 20))
+
+        # ═══════════════════════════════════════════════════════════════
+        # 4. SOURCES & FLAGS
+        # ═══════════════════════════════════════════════════════════════
+        
+        content.append(Paragraph("EVIDENCE & ANALYSIS", _STYLE_SECTION_HEAD))
+        
+        # Sources often share a host, so resolve each URL/domain once per report
+        domain_cache: dict[str, str] = {}
+        badge_cache: dict[str, tuple[str, ParagraphStyle]] = {}
+        
+        # Create Cards
+        for result in sources:  # Show all sources
+            title = str(result.get("title", "Source"))[:80]
+            url = str(result.get("url", ""))
+            content_text = str(result.get("content", ""))[:150]
+            
+            domain = domain_cache.get(url)
+            if domain is None:
+                m = _DOMAIN_RE.match(url)
+                domain = domain_cache[url] = m.group(1) if m else "Web"
+            
+            badge = badge_cache.get(domain)
+            if badge is None:
+                badge = badge_cache[domain] = _source_badge(domain)
+            badge_text, badge_style = badge
+
+            # Source Card Layout
+            card_content = [
+                [
+                    Paragraph(f"<b>{title}</b>", _STYLE_SOURCE_TITLE),
+                    Paragraph(f"{badge_text}", badge_style)
+                ],
+                [
+                    Paragraph(f"<font color='#64748b'>{content_text}...</font>", _STYLE_SOURCE_SNIP),
+                    ""
+                ],
+                [
+                    Paragraph(f"🔗 {domain}", _STYLE_SOURCE_DOM),
+                    ""
+                ]
+            ]
+            
+            # Adjusted column widths to prevent badge overlap (80% / 20%)
+            card = RLTable(card_content, colWidths=[doc.width * 0.8, doc.width * 0.15])
+            card.setStyle(TableStyle([
+                ('BOX', (0, 0), (-1, -1), 0.5, GRAY_200),
+                ('SPAN', (0, 1), (1, 1)),  # Span snippet across
+                ('SPAN', (0, 2), (1, 2)),  # Span domain across
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('PADDING', (0, 0), (-1, -1), 6),
+                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),  # Right align badge
+            ]))
+            
+            content.append(KeepTogether(card))  # Prevent page breaks inside card
+            content.append(Spacer(1, 6))
+    
+        # Red Flags at bottom
+        penalties = a2_result.get("penalties_applied", [])
+        if penalties:
+            content.append(Spacer(1, 10))
+            content.append(Paragraph("Risk Indicators:", _STYLE_RISK))
+            
+            flag_text = ""
+            for name, score in penalties:
+                flag_text += f'&nbsp;&nbsp;<font color="#ef4444">●</font> {name} '
+                
+            content.append(Paragraph(flag_text, _STYLE_FLAGS))
+
+        # Footer
+        content.append(Spacer(1, 30))
+        chain_meta = aep.get("chain_metadata", {})
+        footer_text = f"Report ID: {aep.get('claim_id', 'N/A')} | Type: {chain_meta.get('claim_type_name', 'N/A')} | Generated via MoveH AI"
+        content.append(Paragraph(footer_text, 
+                                 _STYLE_FOOT))
+
+        doc.build(content)
+        return pdf_path
+    
+    except Exception as e:
+        # Fallback: Create a simple PDF if the fancy one fails
+        logger.error(f"PDF generation error: {e}")
+        
+        # Discard whatever the failed build already streamed out
+        pdf_file.seek(0)
+        pdf_file.truncate()
+        
+        doc = SimpleDocTemplate(pdf_file, pagesize=A4)
+        content = [
+            Paragraph("MoveH Fact-Check Report", ParagraphStyle('Title', fontSize=24, spaceAfter=20)),
+            Paragraph(f"Claim: {claim}", ParagraphStyle('Claim', fontSize=12, spaceAfter=10)),
+            Paragraph(f"Verdict: {aep.get('verdict', {}).get('decision', 'UNKNOWN')}", ParagraphStyle('Verdict', fontSize=14, spaceAfter=10)),
+            Paragraph(f"Reasoning: {str(aep.get('reasoning', 'N/A'))[:_MAX_REASONING_CHARS]}", ParagraphStyle('Reasoning', fontSize=10)),
+        ]
+        doc.build(content)
+        return pdf_path
+    
+    finally:
+        pdf_file.close()
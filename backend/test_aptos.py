@@ -4,10 +4,11 @@ Test script for Aptos blockchain integration.
 
 import os
 import time
+import asyncio
 from blockchain import (
+    AptosVerdictClient,
     SyncAptosVerdictClient,
     submit_verdict_to_chain,
-    check_verdict_exists,
 )
 
 
@@ -55,26 +56,24 @@ def test_submit_verdict():
         return None
 
 
-def test_verdict_exists(claim_hash: str = "test_claim_hash_123456789"):
-    """Test checking if verdict exists."""
-    print(f"\n🔍 Testing Verdict Lookup for: {claim_hash[:30]}...")
+async def test_lookup_verdict(claim_hash: str = "test_claim_hash_123456789"):
+    """Test checking and retrieving a verdict, with all view calls in flight at once."""
+    print(f"\n🔍 Testing Verdict Lookup + Retrieval for: {claim_hash[:30]}...")
     
-    exists = check_verdict_exists(claim_hash)
-    print(f"   Verdict exists: {exists}")
-    return exists
-
-
-def test_get_verdict(claim_hash: str = "test_claim_hash_123456789"):
-    """Test retrieving a verdict."""
-    print(f"\n📖 Testing Verdict Retrieval for: {claim_hash[:30]}...")
+    async with AptosVerdictClient() as client:
+        total, exists, record = await asyncio.gather(
+            client.get_total_verdicts(),
+            client.verdict_exists(claim_hash),
+            client.get_verdict(claim_hash),
+        )
     
-    client = SyncAptosVerdictClient()
-    record = client.get_verdict(claim_hash)
+    print(f"   Total verdicts on-chain: {total}")
+    print(f"   Verdict exists: {exists}")
     
     if record:
         print(f"   ✓ Verdict found!")
         print(f"   Claim Hash: {record.claim_hash}")
-        print(f"   Verdict: {client._async_client.verdict_int_to_string(record.verdict)}")
+        print(f"   Verdict: {AptosVerdictClient.verdict_int_to_string(record.verdict)}")
         print(f"   Confidence: {record.confidence}%")
         print(f"   Shelby CID: {record.shelby_cid}")
         return record
@@ -102,11 +101,8 @@ def main():
     claim_hash = test_submit_verdict()
     
     if claim_hash:
-        # Test 3: Check exists
-        test_verdict_exists(claim_hash)
-        
-        # Test 4: Get verdict
-        test_get_verdict(claim_hash)
+        # Test 3: Check exists + get verdict (concurrent view calls)
+        asyncio.run(test_lookup_verdict(claim_hash))
     
     print("\n" + "=" * 50)
     print("✅ Tests Complete!")
@@ -4,54 +4,306 @@ MoveH Full System Test Suite
 
 Run all tests: uv run python test_full_system.py
 Run specific test: uv run python test_full_system.py TestBlockchain
+Include the on-chain submit test: MOVEH_RUN_ONCHAIN=1 uv run python test_full_system.py
 """
 
+import asyncio
+import atexit
+import importlib
+import json
 import os
+import sqlite3
 import sys
+import tempfile
+import threading
 import time
 import unittest
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache, wraps
 
 # Ensure we can import from the project
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Parse .env once for the whole suite; CI injects the variables directly
+IN_CI = bool(os.environ.get("CI"))
+if not IN_CI:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Test status lines, collected while tests run and written to stderr in one go at exit
+_LOG: list[str] = []
+
+
+def log(msg: str):
+    _LOG.append(msg)
+
+
+@atexit.register
+def _flush_log():
+    if _LOG:
+        sys.stderr.write("\n".join(_LOG) + "\n")
+
+# (name, required prefix, required) for every key the system reads
+ENV_KEYS = (
+    ("GOOGLE_API_KEY", None, True),
+    ("TAVILY_API_KEY", None, True),
+    ("GEOMI_API_KEY", "aptoslabs_", False),  # Optional but recommended
+)
+
+# Live chain writes are slow, cost gas and hit rate limits: opt in explicitly
+RUN_ONCHAIN = os.getenv("MOVEH_RUN_ONCHAIN") == "1"
+
+# On-disk cache of chain view results, reused across runs: opt in with MOVEH_CHAIN_CACHE=1,
+# otherwise every run checks the live chain
+CHAIN_CACHE_PATH = os.path.join(tempfile.gettempdir(), "moveh_chain_cache.sqlite")
+USE_CHAIN_CACHE = os.getenv("MOVEH_CHAIN_CACHE") == "1"
+
+
+class CachedAptosClient:
+    """
+    Read-through TTL cache over a SyncAptosVerdictClient's view calls.
+    
+    Repeated reads of the same (method, args) within the TTL skip the RPC;
+    submit_verdict and anything else not listed passes straight through.
+    With a db_path, append-only reads are also persisted to SQLite as JSON and reused
+    across runs for as long as the contract's verdict count is unchanged; scope
+    identifies the network and contract those rows belong to.
+    """
+    
+    CACHED_METHODS = frozenset({
+        "get_total_verdicts", "verdict_exists", "get_verdict", "is_verdict_fresh", "search_by_keyword",
+    })
+    # Only reads that can't change without the verdict count changing go to disk:
+    # update_verdict rewrites a record (and is_verdict_fresh is time-sensitive)
+    PERSISTED_METHODS = frozenset({"verdict_exists", "search_by_keyword"})
+    
+    def __init__(
+        self, client, ttl: float = 30.0, maxsize: int = 512, db_path: str | None = None, scope: tuple = (),
+    ):
+        self._client = client
+        self._scope = scope
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._cache: dict[tuple, tuple[float, object]] = {}
+        self._height: int | None = None
+        self._db = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS views (key TEXT PRIMARY KEY, value TEXT)")
+    
+    def _chain_height(self) -> int:
+        # Verdicts are append-only, so the count changes whenever a new one lands
+        if self._height is None:
+            self._height = self._client.get_total_verdicts()
+        return self._height
+    
+    def _disk_key(self, name: str, args: tuple) -> str:
+        return repr((*self._scope, name, args, self._chain_height()))
+    
+    def _disk_load(self, name: str, args: tuple) -> tuple[bool, object]:
+        """Return (found, value) for a persisted view result."""
+        key = self._disk_key(name, args)
+        with self._db_lock:
+            row = self._db.execute("SELECT value FROM views WHERE key = ?", (key,)).fetchone()
+        return (True, json.loads(row[0])) if row else (False, None)
+    
+    def _disk_store(self, name: str, args: tuple, value):
+        key = self._disk_key(name, args)
+        with self._db_lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO views VALUES (?, ?)", (key, json.dumps(value)))
+    
+    def _persists(self, name: str) -> bool:
+        return self._db is not None and name in self.PERSISTED_METHODS
+    
+    def _persisted(self, name: str, args: tuple, method):
+        """Read a view result from disk, calling through and storing it on a miss."""
+        found, value = self._disk_load(name, args)
+        if not found:
+            value = method(*args)
+            self._disk_store(name, args, value)
+        return value
+    
+    def prefetch(self, *calls: tuple):
+        """
+        Warm the cache with several (method, *args) view calls issued concurrently.
+        
+        The chain height that disk lookups need rides along in the first batch,
+        so it costs no extra serial round-trip; persisted reads missing from disk
+        follow in a second batch. Failed calls are left uncached for the caller
+        to retry and see the error.
+        """
+        disk_calls = [call for call in calls if self._persists(call[0])]
+        live_calls = [call for call in calls if not self._persists(call[0])]
+        if disk_calls and self._height is None and ("get_total_verdicts",) not in live_calls:
+            live_calls.append(("get_total_verdicts",))
+        self._fetch(live_calls)
+        
+        now = time.monotonic()
+        misses = []
+        for name, *args in disk_calls:
+            found, value = self._disk_load(name, tuple(args))
+            if found:
+                self._cache[(name, *args)] = (now, value)
+            else:
+                misses.append((name, *args))
+        self._fetch(misses)
+    
+    def _fetch(self, calls: list[tuple]):
+        """Issue view calls as one concurrent batch and cache the successful results."""
+        if not calls:
+            return
+        now = time.monotonic()
+        for (name, *args), value in zip(calls, _gather_views(calls)):
+            if isinstance(value, BaseException):
+                continue
+            if name == "get_total_verdicts" and self._height is None:
+                self._height = value
+            self._cache[(name, *args)] = (now, value)
+            if self._persists(name):
+                self._disk_store(name, tuple(args), value)
+    
+    def invalidate(self):
+        """Forget every cached view result, in memory and on disk, after a chain write."""
+        self._cache.clear()
+        self._height = None
+        if self._db is not None:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM views")
+    
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+        if name not in self.CACHED_METHODS:
+            return method
+        
+        def cached(*args):
+            key = (name, *args)
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < self._ttl:
+                return hit[1]
+            
+            if self._persists(name):
+                value = self._persisted(name, args, method)
+            else:
+                value = method(*args)
+            if len(self._cache) >= self._maxsize:
+                del self._cache[next(iter(self._cache))]  # Drop the oldest entry
+            self._cache[key] = (now, value)
+            return value
+        
+        cached.__wrapped__ = method  # Uncached call, for reads that must hit the chain
+        return cached
+
+
+def _gather_views(calls: list[tuple]) -> list:
+    """Run (method, *args) view calls concurrently; a call that raised yields its exception."""
+    async def run_all():
+        # A private async client: the sync client's connections belong to its own loop
+        async with _import("blockchain.aptos_client").AptosVerdictClient() as client:
+            return await asyncio.gather(
+                *(getattr(client, name)(*args) for name, *args in calls), return_exceptions=True,
+            )
+    
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run_all())
+    finally:
+        loop.close()
+
+
+def _wait_for_verdict(client, claim_hash: str, deadline: float = 2.0, start: float = 0.05) -> bool:
+    """Poll until a just-submitted verdict is visible, backing off exponentially up to the deadline."""
+    # Bypass the read cache: an earlier "not found" must not satisfy the probe
+    verdict_exists = getattr(client.verdict_exists, "__wrapped__", client.verdict_exists)
+    
+    delay = start
+    end = time.monotonic() + deadline
+    while True:
+        if verdict_exists(claim_hash):
+            return True
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.4)
+
+
+@cache
+def _import(name: str):
+    """Import a project module on first use only, so selecting one class doesn't load every agent."""
+    return importlib.import_module(name)
+
+
+def _shared(factory):
+    """Build a factory's instance once per process, even when several test threads ask at once."""
+    lock = threading.Lock()
+    build = lru_cache(maxsize=1)(factory)
+    
+    @wraps(factory)
+    def get():
+        with lock:
+            return build()
+    
+    return get
+
+
+# Shared clients: built once per process and reused by every test class
+@_shared
+def get_aptos_client():
+    aptos_client = _import("blockchain.aptos_client")
+    return CachedAptosClient(
+        aptos_client.SyncAptosVerdictClient(),
+        db_path=CHAIN_CACHE_PATH if USE_CHAIN_CACHE else None,
+        # Disk rows are scoped to the network and contract, so a redeploy never reads another registry's results
+        scope=(aptos_client.AptosVerdictClient.REST_URL, os.getenv("APTOS_MODULE_ADDRESS")),
+    )
+
+
+@_shared
+def get_chain_lookup():
+    return _import("blockchain.chain_lookup").ChainLookupService()
+
+
+@_shared
+def get_fact_checker():
+    return _import("agents.fact_checker").FactChecker()
+
+
+@_shared
+def get_forensic_expert():
+    return _import("agents.forensic_expert").ForensicExpert()
+
+
+@_shared
+def get_judge():
+    return _import("agents.judge").TheJudge()
+
 
 class TestEnvironment(unittest.TestCase):
     """Test 1: Environment Setup"""
     
+    @unittest.skipIf(IN_CI, "env vars injected by CI")
     def test_env_file_exists(self):
         """Check .env file exists"""
         self.assertTrue(os.path.exists('.env'), "Missing .env file")
-        print("✅ .env file exists")
-    
-    def test_google_api_key(self):
-        """Check Google API key is set"""
-        from dotenv import load_dotenv
-        load_dotenv()
-        key = os.getenv("GOOGLE_API_KEY")
-        self.assertIsNotNone(key, "GOOGLE_API_KEY not set in .env")
-        self.assertTrue(len(key) > 10, "GOOGLE_API_KEY looks invalid")
-        print("✅ GOOGLE_API_KEY is set")
-    
-    def test_tavily_api_key(self):
-        """Check Tavily API key is set"""
-        from dotenv import load_dotenv
-        load_dotenv()
-        key = os.getenv("TAVILY_API_KEY")
-        self.assertIsNotNone(key, "TAVILY_API_KEY not set in .env")
-        self.assertTrue(len(key) > 10, "TAVILY_API_KEY looks invalid")
-        print("✅ TAVILY_API_KEY is set")
-    
-    def test_geomi_api_key(self):
-        """Check Geomi API key is set (optional but recommended)"""
-        from dotenv import load_dotenv
-        load_dotenv()
-        key = os.getenv("GEOMI_API_KEY")
-        if key:
-            self.assertTrue(key.startswith("aptoslabs_"), "GEOMI_API_KEY should start with 'aptoslabs_'")
-            print("✅ GEOMI_API_KEY is set")
-        else:
-            print("⚠️  GEOMI_API_KEY not set - will have rate limits")
+        log("✅ .env file exists")
+    
+    def test_api_keys(self):
+        """Check API keys are set and well-formed"""
+        for name, prefix, required in ENV_KEYS:
+            # Each key reports its own failure, and the rest are still checked
+            with self.subTest(name=name):
+                key = os.getenv(name)
+                if not key:
+                    self.assertFalse(required, f"{name} not set in .env")
+                    log(f"⚠️  {name} not set - will have rate limits")
+                    continue
+                if required:
+                    self.assertTrue(len(key) > 10, f"{name} looks invalid")
+                if prefix:
+                    self.assertTrue(key.startswith(prefix), f"{name} should start with '{prefix}'")
+                log(f"✅ {name} is set")
 
 
 class TestBlockchain(unittest.TestCase):
@@ -59,31 +311,36 @@ class TestBlockchain(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        from dotenv import load_dotenv
-        load_dotenv()
-        from blockchain.aptos_client import SyncAptosVerdictClient
-        cls.client = SyncAptosVerdictClient()
+        cls.client = get_aptos_client()
+        # The reads below are independent: overlap their round-trips, then each test hits the cache
+        cls.client.prefetch(
+            ("get_total_verdicts",),
+            ("search_by_keyword", "test"),
+            ("verdict_exists", "test_claim_cli_003"),
+            ("get_verdict", "test_claim_cli_003"),
+            ("is_verdict_fresh", "test_claim_cli_003"),
+        )
     
     def test_connection(self):
         """Test connection to Aptos testnet"""
         total = self.client.get_total_verdicts()
         self.assertIsInstance(total, int, "Should return integer")
         self.assertGreaterEqual(total, 0, "Total should be >= 0")
-        print(f"✅ Connected to Aptos - {total} verdicts on chain")
+        log(f"✅ Connected to Aptos - {total} verdicts on chain")
     
     def test_search_by_keyword(self):
         """Test keyword search functionality"""
         # Search for 'test' keyword (should exist from previous tests)
         hashes = self.client.search_by_keyword("test")
         self.assertIsInstance(hashes, list, "Should return a list")
-        print(f"✅ Keyword search works - found {len(hashes)} results for 'test'")
+        log(f"✅ Keyword search works - found {len(hashes)} results for 'test'")
     
     def test_verdict_exists(self):
         """Test verdict_exists function"""
         # Check a known hash
         exists = self.client.verdict_exists("test_claim_cli_003")
         self.assertIsInstance(exists, bool, "Should return boolean")
-        print(f"✅ verdict_exists works - 'test_claim_cli_003' exists: {exists}")
+        log(f"✅ verdict_exists works - 'test_claim_cli_003' exists: {exists}")
     
     def test_get_verdict(self):
         """Test retrieving verdict details"""
@@ -91,15 +348,15 @@ class TestBlockchain(unittest.TestCase):
         if record:
             self.assertIsNotNone(record.verdict, "Should have verdict")
             self.assertIsNotNone(record.confidence, "Should have confidence")
-            print(f"✅ get_verdict works - verdict: {record.verdict}, confidence: {record.confidence}")
+            log(f"✅ get_verdict works - verdict: {record.verdict}, confidence: {record.confidence}")
         else:
-            print("⚠️  get_verdict returned None (claim may not exist)")
+            log("⚠️  get_verdict returned None (claim may not exist)")
     
     def test_is_verdict_fresh(self):
         """Test freshness check"""
         fresh = self.client.is_verdict_fresh("test_claim_cli_003")
         self.assertIsInstance(fresh, bool, "Should return boolean")
-        print(f"✅ is_verdict_fresh works - result: {fresh}")
+        log(f"✅ is_verdict_fresh works - result: {fresh}")
 
 
 class TestChainLookup(unittest.TestCase):
@@ -107,95 +364,83 @@ class TestChainLookup(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        from dotenv import load_dotenv
-        load_dotenv()
-        from blockchain.chain_lookup import ChainLookupService
-        cls.service = ChainLookupService()
+        cls.service = get_chain_lookup()
+        # Keyword extraction is an LLM round-trip: do it once, up front, and share the result
+        cls.keywords = cls.service.extract_keywords("Did Tesla acquire Twitter for $100 billion?")
+        cls._test_matches = cls.service.search_chain_by_keywords(["test"])
     
     def test_keyword_extraction(self):
         """Test keyword extraction from query"""
-        keywords = self.service.extract_keywords("Did Tesla acquire Twitter for $100 billion?")
+        keywords = self.keywords
         self.assertIsInstance(keywords, list, "Should return list")
         self.assertGreater(len(keywords), 0, "Should extract at least 1 keyword")
         self.assertLessEqual(len(keywords), 5, "Should limit to 5 keywords")
-        print(f"✅ Keyword extraction works: {keywords}")
+        log(f"✅ Keyword extraction works: {keywords}")
     
     def test_search_chain(self):
         """Test blockchain search by keywords"""
-        matches = self.service.search_chain_by_keywords(["test"])
+        matches = self._test_matches
         self.assertIsInstance(matches, list, "Should return list")
-        print(f"✅ Chain search works - found {len(matches)} matches")
+        log(f"✅ Chain search works - found {len(matches)} matches")
     
     def test_full_lookup_no_match(self):
         """Test lookup for non-existent claim"""
         result = self.service.find_existing_verdict("XYZ random claim that doesn't exist 12345")
         # Should return None for non-existent claims
-        print(f"✅ Full lookup works - result for random claim: {result}")
+        log(f"✅ Full lookup works - result for random claim: {result}")
     
     def test_full_lookup_with_test(self):
         """Test lookup for 'test' keyword (should find matches)"""
         result = self.service.find_existing_verdict("This is a test claim")
         if result:
             self.assertIsNotNone(result.verdict, "Should have verdict")
-            print(f"✅ Found cached verdict: {result.verdict} ({result.confidence}%)")
+            log(f"✅ Found cached verdict: {result.verdict} ({result.confidence}%)")
         else:
-            print("⚠️  No cached verdict found for 'test' claim")
+            log("⚠️  No cached verdict found for 'test' claim")
 
 
 class TestAgents(unittest.TestCase):
     """Test 4: AI Agents"""
     
-    @classmethod
-    def setUpClass(cls):
-        from dotenv import load_dotenv
-        load_dotenv()
-    
-    def test_fact_checker_import(self):
-        """Test Fact Checker agent can be imported"""
-        from agents.fact_checker import FactChecker
-        agent = FactChecker()
-        self.assertIsNotNone(agent, "Should create agent")
-        print("✅ Fact Checker agent imports correctly")
-    
-    def test_forensic_expert_import(self):
-        """Test Forensic Expert agent can be imported"""
-        from agents.forensic_expert import ForensicExpert
-        agent = ForensicExpert()
-        self.assertIsNotNone(agent, "Should create agent")
-        print("✅ Forensic Expert agent imports correctly")
-    
-    def test_judge_import(self):
-        """Test Judge agent can be imported"""
-        from agents.judge import TheJudge
-        agent = TheJudge()
-        self.assertIsNotNone(agent, "Should create agent")
-        print("✅ Judge agent imports correctly")
+    def test_agents_import(self):
+        """Test all three agents can be created (concurrently: each sets up its own LLM client)"""
+        factories = {
+            "Fact Checker": get_fact_checker,
+            "Forensic Expert": get_forensic_expert,
+            "Judge": get_judge,
+        }
+        # Built through the shared factories, so TestEndToEnd reuses these instances
+        with ThreadPoolExecutor(max_workers=len(factories)) as executor:
+            agents = dict(zip(factories, executor.map(lambda factory: factory(), factories.values())))
+        
+        for name, agent in agents.items():
+            self.assertIsNotNone(agent, f"{name} should create agent")
+            log(f"✅ {name} agent imports correctly")
 
 
+@unittest.skipUnless(RUN_ONCHAIN, "on-chain write test; set MOVEH_RUN_ONCHAIN=1 to enable")
 class TestSubmitVerdict(unittest.TestCase):
     """Test 5: Submit Verdict to Blockchain (Integration Test)"""
     
     @classmethod
     def setUpClass(cls):
-        from dotenv import load_dotenv
-        load_dotenv()
-        from blockchain.aptos_client import SyncAptosVerdictClient
-        cls.client = SyncAptosVerdictClient()
+        cls.client = get_aptos_client()
     
     def test_submit_verdict(self):
         """Test submitting a verdict to blockchain"""
         # Create test metadata
-        test_hash = f"test_claim_python_{int(time.time())}"
+        now = int(time.time())  # One timestamp, so the hash and the metadata can't straddle a second
+        test_hash = f"test_claim_python_{now}"
         chain_metadata = {
             "claim_hash": test_hash,
             "claim_signature": "test_sig",
             "keywords": ["test", "python", "automated"],
             "claim_type": 2,
-            "timestamp_unix": int(time.time()),
+            "timestamp_unix": now,
             "expires_at": 0,
         }
         
-        print(f"\n📤 Submitting test verdict with hash: {test_hash}")
+        log(f"\n📤 Submitting test verdict with hash: {test_hash}")
         
         tx_hash = self.client.submit_verdict(
             chain_metadata=chain_metadata,
@@ -205,15 +450,15 @@ class TestSubmitVerdict(unittest.TestCase):
         )
         
         if tx_hash:
-            print(f"✅ Verdict submitted! TX: {tx_hash}")
+            log(f"✅ Verdict submitted! TX: {tx_hash}")
+            self.client.invalidate()  # Earlier reads no longer reflect the chain
             
-            # Verify it was stored
-            time.sleep(2)  # Wait for transaction to be indexed
-            exists = self.client.verdict_exists(test_hash)
+            # Verify it was stored, polling until the transaction is indexed
+            exists = _wait_for_verdict(self.client, test_hash)
             self.assertTrue(exists, "Verdict should exist after submission")
-            print(f"✅ Verified verdict exists on chain")
+            log("✅ Verified verdict exists on chain")
         else:
-            print("⚠️  Submission failed - likely rate limited. Add GEOMI_API_KEY to .env")
+            log("⚠️  Submission failed - likely rate limited. Add GEOMI_API_KEY to .env")
             self.skipTest("Rate limited - need GEOMI_API_KEY")
 
 
@@ -222,67 +467,112 @@ class TestEndToEnd(unittest.TestCase):
     
     def test_full_pipeline_dry_run(self):
         """Test the full pipeline can be initialized"""
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        # Import main components
-        from agents.fact_checker import FactChecker
-        from agents.forensic_expert import ForensicExpert
-        from agents.judge import TheJudge
-        from blockchain.chain_lookup import ChainLookupService
-        from blockchain.aptos_client import SyncAptosVerdictClient
-        
-        # Initialize all components
-        fact_checker = FactChecker()
-        forensic_expert = ForensicExpert()
-        judge = TheJudge()
-        chain_lookup = ChainLookupService()
-        aptos_client = SyncAptosVerdictClient()
+        # Shared instances (built here if no earlier test needed them)
+        components = {
+            "Fact Checker": get_fact_checker(),
+            "Forensic Expert": get_forensic_expert(),
+            "Judge": get_judge(),
+            "Chain Lookup": get_chain_lookup(),
+            "Aptos Client": get_aptos_client(),
+        }
+        for name, component in components.items():
+            self.assertIsNotNone(component, f"{name} should initialize")
         
-        print("✅ All pipeline components initialized successfully")
-        print("   - Fact Checker: Ready")
-        print("   - Forensic Expert: Ready")
-        print("   - Judge: Ready")
-        print("   - Chain Lookup: Ready")
-        print("   - Aptos Client: Ready")
+        log("✅ All pipeline components initialized successfully")
+        log("   - Fact Checker: Ready")
+        log("   - Forensic Expert: Ready")
+        log("   - Judge: Ready")
+        log("   - Chain Lookup: Ready")
+        log("   - Aptos Client: Ready")
+
+
+# Test classes that use the shared Aptos client, run in this order on one thread
+APTOS_CLIENT_CLASSES = (TestBlockchain, TestSubmitVerdict, TestEndToEnd)
 
 
 def run_tests():
     """Run all tests with nice output"""
     print("\n" + "="*70)
     print("🛡️  MoveH - Full System Test Suite")
-    print("="*70 + "\n")
+    print("="*70)
+    if not RUN_ONCHAIN:
+        print("⏭️  Skipping on-chain submit test (set MOVEH_RUN_ONCHAIN=1 to run it)")
+    print()
     
-    # Create test suite
+    # One pass over the module: a suite per test class
+    module = sys.modules[__name__]
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add test classes in order
-    test_classes = [
-        TestEnvironment,
-        TestBlockchain,
-        TestChainLookup,
-        TestAgents,
-        TestSubmitVerdict,
-        TestEndToEnd,
-    ]
-    
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    # Run with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Summary
+    suites = {
+        type(next(iter(suite))): suite
+        for suite in loader.loadTestsFromModule(module)
+        if suite.countTestCases()
+    }
+    # The loader walks dir() alphabetically; report in definition order instead.
+    # Loader stand-ins such as unittest.loader._FailedTest aren't module names and sort last.
+    definition_order = {name: i for i, name in enumerate(vars(module))}
+    class_suites = {
+        test_class: suites[test_class]
+        for test_class in sorted(
+            suites, key=lambda test_class: definition_order.get(test_class.__name__, len(definition_order))
+        )
+    }
+    
+    # Classes sharing the Aptos client stay on one thread: its sync wrapper drives
+    # a per-thread event loop. TestSubmitVerdict is the only chain writer.
+    # Every other loaded class, including any added later, runs in a group of its own.
+    aptos_group = [test_class for test_class in class_suites if test_class in APTOS_CLIENT_CLASSES]
+    test_groups = [aptos_group] if aptos_group else []
+    test_groups += [[test_class] for test_class in class_suites if test_class not in APTOS_CLIENT_CLASSES]
+    
+    def run_group(group):
+        """Run a group of test classes in order, silently: the summary below reports the results."""
+        # A bare TestResult rather than TextTestRunner: the runner swaps the process-wide
+        # warning filters (warnings.catch_warnings), which isn't safe across threads
+        runs = {}
+        for test_class in group:
+            runs[test_class] = unittest.TestResult()
+            class_suites[test_class].run(runs[test_class])
+        return runs
+    
+    # Groups are independent and I/O-bound on Aptos RPC / LLM setup, so run them concurrently
+    class_runs = {}
+    with ThreadPoolExecutor(max_workers=len(test_groups)) as executor:
+        for runs in executor.map(run_group, test_groups):
+            class_runs.update(runs)
+    
+    # Merge the per-class results in definition order
+    result = unittest.TestResult()
+    for test_class in class_suites:
+        class_result = class_runs[test_class]
+        result.testsRun += class_result.testsRun
+        result.failures.extend(class_result.failures)
+        result.errors.extend(class_result.errors)
+        result.skipped.extend(class_result.skipped)
+        result.unexpectedSuccesses.extend(class_result.unexpectedSuccesses)
+    
+    # Failure details
+    for test, details in result.failures + result.errors:
+        print(f"\n❌ {test}\n{details}")
+    
+    # Summary, counted per test: each failing subTest adds its own entry to result.failures
+    def test_id(test) -> str:
+        return getattr(test, "test_case", test).id()
+    
+    fails = len({test_id(test) for test, _ in result.failures})
+    errs = len({test_id(test) for test, _ in result.errors})
+    skipped = len(result.skipped)
+    # setUpClass errors are reported under a placeholder, not a test counted in testsRun
+    broken = {test_id(test) for test, _ in result.failures + result.errors if isinstance(test, unittest.TestCase)}
+    passed = result.testsRun - len(broken) - skipped
+    
     print("\n" + "="*70)
     print("📊 Test Summary")
     print("="*70)
     print(f"   Tests Run: {result.testsRun}")
-    print(f"   ✅ Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"   ❌ Failed: {len(result.failures)}")
-    print(f"   ⚠️  Errors: {len(result.errors)}")
+    print(f"   ✅ Passed: {passed}")
+    print(f"   ❌ Failed: {fails}")
+    print(f"   ⚠️  Errors: {errs}")
+    print(f"   ⏭️  Skipped: {skipped}")
     print("="*70 + "\n")
     
     return result